@@ -1,5 +1,7 @@
 from celery import Celery
-from utils.load_env import settings
+from utils.load_env import get_settings
+
+settings = get_settings()
 
 app = Celery(
     "ai_crypto_trading_bot",
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from domain.evaluator import Evaluator
@@ -21,5 +22,8 @@ class EngineComponent(ABC):
         pass
 
     @abstractmethod
-    def run(self, run_once: bool = False) -> None:
+    async def run_async(self, run_once: bool = False) -> None:
         pass
+
+    def run(self, run_once: bool = False) -> None:
+        asyncio.run(self.run_async(run_once=run_once))
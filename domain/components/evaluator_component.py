@@ -3,18 +3,43 @@ from typing import List
 
 from domain.models.coin import Coin
 from domain.ports.market_data_port import MarketDataPort
+from domain.screening import select_candidates
 from utils.load_env import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class EvaluatorComponent(ABC):
+    config: Settings
+
     @abstractmethod
     def __init__(self, market_data: MarketDataPort, config: Settings):
         pass
 
+    @property
+    def candidate_threshold(self) -> float:
+        """The minimum price change for a coin to be a candidate."""
+        return self.config.trade.price_change_threshold
+
     @abstractmethod
     def is_candidate(self, coin: Coin) -> bool:
         pass
 
+    def filter_candidates(self, coins: List[Coin]) -> List[Coin]:
+        """
+        Returns the coins whose price change meets `candidate_threshold`,
+        screened in one vectorized pass over their price changes.
+        """
+        candidates = select_candidates(coins, self.candidate_threshold)
+        logger.debug(
+            "%s: %d of %d coins meet the price change threshold.",
+            type(self).__name__,
+            len(candidates),
+            len(coins),
+        )
+        return candidates
+
     @abstractmethod
     def check_liquidity_pools(self, coin: Coin) -> List[dict]:
         pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from domain.models.coin import Coin
+from domain.models.paper_order import PaperOrder
 from domain.ports.data_storage_port import DataStoragePort
 from domain.ports.decision_engine_port import DecisionEnginePort
 from utils.load_env import Settings
@@ -22,5 +23,10 @@ class StrategyComponent(ABC):
         pass
 
     @abstractmethod
-    def evaluate_and_execute_sell(self, coin: Coin, current_price: float):
+    def evaluate_and_execute_sell(
+        self,
+        coin: Coin,
+        current_price: float,
+        buy_orders: Optional[List[PaperOrder]] = None,
+    ):
         pass
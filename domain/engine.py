@@ -3,26 +3,35 @@ The core trading engine that orchestrates the trading cycle.
 """
 from __future__ import annotations
 
+import asyncio
+import signal
 import threading
-import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from domain.components.engine_component import EngineComponent
 from domain.exceptions import DataStorageError, DecisionEngineError, MarketDataError
 from domain.plugin_loader import load_plugin
 from utils.load_env import Settings
-from utils.logger import get_logger
+from utils.logger import get_logger, request_id_var
 
 if TYPE_CHECKING:
     from domain.evaluator import Evaluator
     from domain.models.coin import Coin
+    from domain.models.paper_order import PaperOrder
     from domain.ports.data_storage_port import DataStoragePort
     from domain.ports.market_data_port import MarketDataPort
     from domain.strategy import Strategy
 
 logger = get_logger(__name__)
 
+# How long before the end of the sleep window the next cycle's prices start
+# being fetched, so the request is already in flight when the cycle begins.
+PRICE_PREFETCH_LEAD_SECONDS = 30
+
 
 class Engine(EngineComponent):
     """
@@ -76,76 +85,285 @@ class Engine(EngineComponent):
 
         logger.info("Trading Engine initialized.")
 
-    def run(self, run_once: bool = False) -> None:
-        """Continuously run trading cycles."""
-        import uuid
-        from utils.logger import request_id_var
+    async def run_async(self, run_once: bool = False) -> None:
+        """
+        Continuously run trading cycles until SIGINT/SIGTERM is received.
 
+        The sleep between cycles waits on a shutdown event instead of blocking
+        the thread, so a signal ends it immediately. A signal received
+        mid-cycle lets the cycle finish before the engine stops.
+        """
         logger.info("Starting trading engine...")
-        while True:
-            # Set a unique ID for this trading cycle for traceability
-            request_id = str(uuid.uuid4())
-            request_id_var.set(request_id)
-
-            logger.info("Starting new trading cycle.")
-            self._run_cycle()
-            if run_once:
-                logger.info("Run-once flag is set, shutting down.")
-                break
-            logger.info(
-                f"Engine cycle complete, sleeping for {self.loop_interval} seconds."
-            )
-            time.sleep(self.loop_interval)
+        shutdown_event = asyncio.Event()
+        installed_signals = self._install_signal_handlers(shutdown_event)
+        prefetch: Optional[asyncio.Task[Dict[str, float]]] = None
+        try:
+            while not shutdown_event.is_set():
+                # Set a unique ID for this trading cycle for traceability
+                request_id_var.set(str(uuid.uuid4()))
+
+                logger.info("Starting new trading cycle.")
+                try:
+                    await self._run_cycle(await self._collect_prefetch(prefetch))
+                except Exception as e:
+                    # Last resort: one failed cycle must not stop the engine.
+                    logger.error(f"An unexpected error occurred during the trading cycle: {e}", exc_info=True)
+                if run_once:
+                    logger.info("Run-once flag is set, shutting down.")
+                    break
+                logger.info(
+                    f"Engine cycle complete, sleeping for {self.loop_interval} seconds."
+                )
+                prefetch = await self._wait_for_next_cycle(shutdown_event)
+        finally:
+            loop = asyncio.get_running_loop()
+            for sig in installed_signals:
+                loop.remove_signal_handler(sig)
+        logger.info("Trading engine stopped.")
+
+    @staticmethod
+    def _install_signal_handlers(shutdown_event: asyncio.Event) -> List[int]:
+        """
+        Routes SIGINT/SIGTERM to `shutdown_event`. Returns the signals that
+        were installed, which is none on platforms or threads where the event
+        loop cannot handle signals.
+        """
+        loop = asyncio.get_running_loop()
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, shutdown_event.set)
+            except (NotImplementedError, RuntimeError, ValueError):
+                logger.debug(f"Cannot install a handler for {sig!r} here.")
+                continue
+            installed.append(sig)
+        return installed
+
+    @staticmethod
+    async def _wait(shutdown_event: asyncio.Event, timeout: float) -> bool:
+        """Waits up to `timeout` seconds; returns True if shutdown was requested."""
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _wait_for_next_cycle(
+        self, shutdown_event: asyncio.Event
+    ) -> Optional[asyncio.Task[Dict[str, float]]]:
+        """
+        Sleeps for `loop_interval` seconds, starting the next cycle's price
+        prefetch shortly before waking up. Returns the prefetch task, or None
+        if shutdown was requested during the sleep.
+        """
+        lead = min(PRICE_PREFETCH_LEAD_SECONDS, self.loop_interval)
+        if await self._wait(shutdown_event, self.loop_interval - lead):
+            return None
+        prefetch = asyncio.create_task(self._prefetch_prices())
+        if await self._wait(shutdown_event, lead):
+            prefetch.cancel()
+            return None
+        return prefetch
+
+    async def _prefetch_prices(self) -> Dict[str, float]:
+        """Fetches the prices of the current candidate coins."""
+        coins = await asyncio.to_thread(self.storage.get_all_coins)
+        candidates = self.evaluator.filter_candidates(coins)
+        if not candidates:
+            return {}
+        return await asyncio.to_thread(
+            self.market_data.get_prices_by_coin_ids,
+            [coin.coin_id for coin in candidates],
+        )
+
+    @staticmethod
+    async def _collect_prefetch(
+        prefetch: Optional[asyncio.Task[Dict[str, float]]],
+    ) -> Dict[str, float]:
+        """
+        Returns the prefetched prices, or an empty dict if there was no
+        prefetch or it failed, in which case the cycle fetches them itself.
+        """
+        if prefetch is None:
+            return {}
+        try:
+            return await prefetch
+        except (DataStorageError, MarketDataError) as e:
+            logger.warning(f"Price prefetch failed, fetching in cycle: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while prefetching prices: {e}", exc_info=True)
+            return {}
+
+    def _load_cycle_data(
+        self,
+    ) -> Tuple[List[Coin], Dict[str, List[PaperOrder]]]:
+        """
+        Loads the coins and open BUY orders for a cycle.
+
+        The two reads are independent, so they are issued concurrently (each
+        storage call checks out its own connection/file handle) and the cycle
+        waits for the slower one instead of their sum. Orders may be streamed
+        by the storage adapter, so the worker consumes the stream straight
+        into a per-symbol index.
+        """
+
+        def index_buy_orders() -> Dict[str, List[PaperOrder]]:
+            orders_by_symbol: Dict[str, List[PaperOrder]] = defaultdict(list)
+            for order in self.storage.get_all_orders("BUY"):
+                orders_by_symbol[order.symbol].append(order)
+            return orders_by_symbol
 
-    def _run_cycle(self) -> None:
-        """Executes a single trading cycle."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            coins_future = executor.submit(self.storage.get_all_coins)
+            orders_future = executor.submit(index_buy_orders)
+            return coins_future.result(), orders_future.result()
+
+    async def _run_cycle(
+        self, prefetched_prices: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Executes a single trading cycle.
+
+        Candidate prices not already in `prefetched_prices` are fetched in a
+        single batched request, and pool
+        checks run concurrently, bounded by `api.max_concurrency` to respect
+        provider rate limits, since the cycle is dominated by network round
+        trips. Strategy execution then runs sequentially because it mutates
+        storage.
+        """
         try:
-            coins = self.storage.get_all_coins()
+            coins, buy_orders = self._load_cycle_data()
         except DataStorageError as e:
-            logger.error(f"Error getting coins from storage: {e}", exc_info=True)
+            logger.error(f"Error loading cycle data from storage: {e}", exc_info=True)
+            return
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while loading cycle data: {e}", exc_info=True)
             return
 
         if not coins:
             logger.warning("No coins found in local storage. Skipping cycle.")
             return
 
-        for coin in coins:
+        logger.info(
+            f"Loaded {len(coins)} coins and "
+            f"{sum(map(len, buy_orders.values()))} buy orders."
+        )
+
+        candidates = self.evaluator.filter_candidates(coins)
+        if not candidates:
+            logger.info("No candidate coins this cycle.")
+            return
+
+        # One batched request for every candidate price instead of one
+        # round trip per coin. The result is reused for the whole cycle.
+        prices = dict(prefetched_prices or {})
+        missing_ids = [coin.coin_id for coin in candidates if coin.coin_id not in prices]
+        if missing_ids:
             try:
-                if not self.evaluator.is_candidate(coin):
-                    continue
+                prices.update(
+                    await asyncio.to_thread(
+                        self.market_data.get_prices_by_coin_ids, missing_ids
+                    )
+                )
+            except MarketDataError as e:
+                logger.error(f"Error fetching prices for candidates: {e}", exc_info=True)
+                return
+            except Exception as e:
+                logger.error(f"An unexpected error occurred while fetching prices for candidates: {e}", exc_info=True)
+                return
 
-                current_price = self.market_data.get_price_by_coin_id(coin.coin_id)
-                if current_price is None:
-                    logger.warning(f"Unable to fetch price for {coin.symbol}, skipping.")
-                    continue
+        priced_coins = []
+        for coin in candidates:
+            if coin.coin_id in prices:
+                priced_coins.append(coin)
+            else:
+                logger.warning(f"Unable to fetch price for {coin.symbol}, skipping.")
 
-                safe_pools = self.evaluator.check_liquidity_pools(coin)
-                if not safe_pools:
-                    logger.debug(f"No safe pools found for {coin.symbol}, skipping buy evaluation.")
-                else:
-                    self.strategy.evaluate_and_execute_buy(coin, current_price, safe_pools)
+        semaphore = asyncio.Semaphore(self.config.api.max_concurrency)
+        safe_pools_per_coin = await asyncio.gather(
+            *(self._fetch_safe_pools(coin, semaphore) for coin in priced_coins)
+        )
 
-                self.strategy.evaluate_and_execute_sell(coin, current_price)
+        # One timestamp for the whole cycle, so its PnL entries line up.
+        cycle_time = datetime.now()
+        # Coalesce the cycle's storage writes into one flush per file. The
+        # flush runs when the block exits, outside the per-coin handlers.
+        try:
+            with self.storage.transaction():
+                for coin, safe_pools in zip(priced_coins, safe_pools_per_coin, strict=True):
+                    if safe_pools is not None:
+                        self._process_coin(
+                            coin,
+                            prices[coin.coin_id],
+                            safe_pools,
+                            buy_orders.get(coin.symbol, []),
+                            cycle_time,
+                        )
+        except DataStorageError as e:
+            logger.error(f"Error writing cycle results to storage: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while writing cycle results: {e}", exc_info=True)
 
-                # Record PnL for the portfolio
-                self.storage.add_pnl_entry_by_symbol(
-                    coin.symbol, datetime.now(), current_price
+    async def _fetch_safe_pools(
+        self, coin: Coin, semaphore: asyncio.Semaphore
+    ) -> Optional[List[dict]]:
+        """
+        Returns the safe liquidity pools for a coin, or None if the coin
+        should be skipped this cycle.
+        """
+        try:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.evaluator.check_liquidity_pools, coin
                 )
+        except (DataStorageError, MarketDataError, DecisionEngineError) as e:
+            logger.error(f"Error processing coin {coin.symbol}: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while processing coin {coin.symbol}: {e}", exc_info=True)
+        return None
 
-                if self.config.shadow_mode_enabled and self.shadow_evaluator and self.shadow_strategy:
-                    logger.debug(f"Running shadow evaluation for {coin.symbol}...")
-                    shadow_thread = threading.Thread(
-                        target=self._run_shadow_evaluation,
-                        args=(coin, current_price),
-                        daemon=True # Allow program to exit even if shadow thread is running
-                    )
-                    shadow_thread.start()
-            except (DataStorageError, MarketDataError, DecisionEngineError) as e:
-                logger.error(f"Error processing coin {coin.symbol}: {e}", exc_info=True)
-            except Exception as e:
-                logger.error(f"An unexpected error occurred while processing coin {coin.symbol}: {e}", exc_info=True)
+    def _process_coin(
+        self,
+        coin: Coin,
+        current_price: float,
+        safe_pools: List[dict],
+        buy_orders: List[PaperOrder],
+        cycle_time: datetime,
+    ) -> None:
+        """
+        Runs the strategy for a single coin with pre-fetched market data.
+        `cycle_time` is the timestamp recorded for the coin's PnL entry.
+        """
+        try:
+            if not safe_pools:
+                logger.debug(f"No safe pools found for {coin.symbol}, skipping buy evaluation.")
+            else:
+                self.strategy.evaluate_and_execute_buy(coin, current_price, safe_pools)
+
+            self.strategy.evaluate_and_execute_sell(coin, current_price, buy_orders)
 
-    def _run_shadow_evaluation(self, coin: Coin, current_price: float) -> None:
+            # Record PnL for the portfolio
+            self.storage.add_pnl_entry_by_symbol(
+                coin.symbol, cycle_time, current_price
+            )
+
+            if self.config.shadow_mode_enabled and self.shadow_evaluator and self.shadow_strategy:
+                logger.debug(f"Running shadow evaluation for {coin.symbol}...")
+                shadow_thread = threading.Thread(
+                    target=self._run_shadow_evaluation,
+                    args=(coin, current_price, buy_orders),
+                    daemon=True # Allow program to exit even if shadow thread is running
+                )
+                shadow_thread.start()
+        except (DataStorageError, MarketDataError, DecisionEngineError) as e:
+            logger.error(f"Error processing coin {coin.symbol}: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while processing coin {coin.symbol}: {e}", exc_info=True)
+
+    def _run_shadow_evaluation(
+        self, coin: Coin, current_price: float, buy_orders: List[PaperOrder]
+    ) -> None:
         """Executes the shadow evaluation logic for a single coin."""
         try:
             shadow_is_candidate = self.shadow_evaluator.is_candidate(coin)
@@ -165,7 +383,9 @@ class Engine(EngineComponent):
             else:
                 logger.info(f"[SHADOW] {coin.symbol} - No safe pools found for buy evaluation.")
 
-            self.shadow_strategy.evaluate_and_execute_sell(coin, current_price)
+            self.shadow_strategy.evaluate_and_execute_sell(
+                coin, current_price, buy_orders
+            )
 
         except Exception as e:
             logger.error(f"[SHADOW] Error during shadow evaluation for {coin.symbol}: {e}", exc_info=True)
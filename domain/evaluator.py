@@ -6,6 +6,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List
 
 from domain.components.evaluator_component import EvaluatorComponent
+from domain.liquidity import select_safe_pools
 from domain.models.coin import Coin
 from utils.load_env import Settings
 from utils.logger import get_logger
@@ -30,10 +31,10 @@ class Evaluator(EvaluatorComponent):
         """
         Checks if a coin meets the basic criteria for a trade analysis.
         """
-        if coin.price_change < self.config.trade.price_change_threshold:
+        if coin.price_change < self.candidate_threshold:
             logger.debug(
                 f"Skipping {coin.symbol} due to low price change: "
-                f"{coin.price_change} < {self.config.trade.price_change_threshold}"
+                f"{coin.price_change} < {self.candidate_threshold}"
             )
             return False
         return True
@@ -47,16 +48,6 @@ class Evaluator(EvaluatorComponent):
         pools_data = (
             pools_response.get("data", []) if isinstance(pools_response, dict) else []
         )
-        safe_pools = []
-        for pool in pools_data:
-            reserve = pool.get("reserve_in_usd", 0)
-            volume = pool.get("volume_in_usd", {}).get("h24", 0)
-            buys = pool.get("buys_24h", 0)
-            if (
-                reserve >= self.config.pool.min_reserves_usd
-                and volume >= self.config.pool.min_volume_24h
-                and buys >= self.config.pool.min_buys_24h
-            ):
-                safe_pools.append(pool)
+        safe_pools = select_safe_pools(pools_data, self.config.pool)
         logger.debug(f"Found {len(safe_pools)} safe pools for {coin.symbol}.")
         return safe_pools
@@ -0,0 +1,53 @@
+"""
+Helpers for checking open orders against the stop-loss and take-profit levels.
+"""
+from typing import List, NamedTuple
+
+import numpy as np
+
+from domain.models.paper_order import PaperOrder
+from utils.load_env import TradeSettings
+
+
+class ExitSignal(NamedTuple):
+    """An open order whose stop-loss or take-profit level has been reached."""
+
+    order: PaperOrder
+    stop_loss_hit: bool
+    pnl_percentage: float
+
+
+def select_exit_orders(
+    buy_orders: List[PaperOrder], current_price: float, trade: TradeSettings
+) -> List[ExitSignal]:
+    """
+    Returns the orders that should be sold at `current_price`.
+
+    The buy prices are packed into a single float array so the stop-loss and
+    take-profit checks run as one vectorized mask; only triggered orders,
+    usually few, are turned back into Python objects.
+
+    Args:
+        buy_orders: The coin's open BUY orders.
+        current_price: The coin's current price.
+        trade: The stop-loss and take-profit percentages.
+
+    Returns:
+        The exit signals, in the original order of `buy_orders`.
+    """
+    if not buy_orders:
+        return []
+
+    buy_prices = np.fromiter(
+        (order.buy_price for order in buy_orders),
+        dtype=np.float64,
+        count=len(buy_orders),
+    )
+    stop_loss_hit = current_price <= buy_prices * (1 - trade.stop_loss / 100)
+    take_profit_hit = current_price >= buy_prices * (1 + trade.take_profit / 100)
+    pnl_percentage = (current_price - buy_prices) / buy_prices * 100
+
+    return [
+        ExitSignal(buy_orders[i], bool(stop_loss_hit[i]), float(pnl_percentage[i]))
+        for i in np.flatnonzero(stop_loss_hit | take_profit_hit)
+    ]
@@ -0,0 +1,45 @@
+"""
+Helpers for screening liquidity pools against the pool safety thresholds.
+"""
+from typing import List
+
+import numpy as np
+
+from utils.load_env import PoolSafetySettings
+
+
+def select_safe_pools(pools_data: List[dict], pool: PoolSafetySettings) -> List[dict]:
+    """
+    Returns the pools whose reserves, 24h volume and 24h buys all meet the
+    configured minimums.
+
+    The three metrics are packed into a single float array so the threshold
+    checks run as one vectorized mask instead of per-pool Python comparisons.
+
+    Args:
+        pools_data: Pool dictionaries as returned by the market data provider.
+        pool: The pool safety thresholds.
+
+    Returns:
+        The safe pools, in their original order.
+    """
+    if not pools_data:
+        return []
+
+    metrics = np.array(
+        [
+            (
+                p.get("reserve_in_usd", 0),
+                p.get("volume_in_usd", {}).get("h24", 0),
+                p.get("buys_24h", 0),
+            )
+            for p in pools_data
+        ],
+        dtype=np.float64,
+    )
+    mask = (
+        (metrics[:, 0] >= pool.min_reserves_usd)
+        & (metrics[:, 1] >= pool.min_volume_24h)
+        & (metrics[:, 2] >= pool.min_buys_24h)
+    )
+    return [pools_data[i] for i in np.flatnonzero(mask)]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -10,6 +10,9 @@ class Coin:
     realized_pnl: float = 0.0
     price_change: float = 0.0
     prices: List[list] = field(default_factory=list)
+    _context_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Coin":
@@ -25,7 +28,8 @@ class Coin:
             symbol=symbol,
             realized_pnl=data.get("realizedPnl", 0.0),
             price_change=data.get("priceChange") or 0.0,
-            prices=data.get("prices", []),
+            # Copy so extending a coin's prices never mutates the source data.
+            prices=list(data.get("prices", [])),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -36,3 +40,16 @@ class Coin:
             'priceChange': self.price_change,
             'prices': self.prices
         }
+
+    def to_context_dict(self, max_prices: int) -> Dict[str, Any]:
+        """
+        Returns the coin as decision engine context, keeping only the
+        `max_prices` most recent price rows. The result is cached on the
+        instance until the coin's price change, PnL or price history changes.
+        """
+        key = (max_prices, self.price_change, self.realized_pnl, len(self.prices))
+        if self._context_cache is None or self._context_cache[0] != key:
+            context = self.to_dict()
+            context["prices"] = self.prices[-max_prices:] if max_prices > 0 else []
+            self._context_cache = (key, context)
+        return self._context_cache[1]
@@ -3,7 +3,7 @@ Defines the interface (port) for data storage services.
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import ContextManager, Iterable, List, Literal, Optional, Union
 
 from domain.models.coin import Coin
 from domain.models.paper_order import PaperOrder
@@ -16,6 +16,15 @@ class DataStoragePort(ABC):
     combining coin, order, and portfolio operations.
     """
 
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """
+        Groups the writes made inside the block. Adapters may buffer them and
+        persist once when the block exits; reads inside the block still see
+        the buffered changes.
+        """
+        raise NotImplementedError
+
     # --- Coin Methods ---
     @abstractmethod
     def get_all_coins(self) -> List[Coin]:
@@ -43,19 +52,33 @@ class DataStoragePort(ABC):
 
     @abstractmethod
     def update_coin_price_change(
-        self, symbol: str, price_change: float
-    ) -> Optional[Coin]:
+        self, symbol: str, price_change: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
+        """
+        Updates a coin's price change. Returns the updated coin when `fetch`
+        is True, otherwise only whether a coin was updated.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def update_coin_pnl(self, symbol: str, new_realized_pnl: float) -> Optional[Coin]:
+    def update_coin_pnl(
+        self, symbol: str, new_realized_pnl: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
+        """
+        Updates a coin's realized PnL. Returns the updated coin when `fetch`
+        is True, otherwise only whether a coin was updated.
+        """
         raise NotImplementedError
 
     # --- Order Methods ---
     @abstractmethod
     def get_all_orders(
         self, direction: Optional[Literal["BUY", "SELL"]] = None
-    ) -> List[PaperOrder]:
+    ) -> Iterable[PaperOrder]:
+        """
+        Returns the orders, optionally filtered by direction. Implementations
+        may stream results, so callers should iterate rather than index.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -71,7 +94,11 @@ class DataStoragePort(ABC):
 
     # --- Portfolio Methods ---
     @abstractmethod
-    def get_all_portfolio_items(self) -> List[PortfolioItem]:
+    def get_all_portfolio_items(self) -> Iterable[PortfolioItem]:
+        """
+        Returns the portfolio items. Implementations may stream results, so
+        callers should iterate rather than index.
+        """
         raise NotImplementedError
 
     @abstractmethod
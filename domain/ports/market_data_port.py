@@ -13,7 +13,20 @@ class MarketDataPort(ABC):
 
     @abstractmethod
     def get_price_by_coin_id(self, coin_id: str) -> Optional[float]:
-        """Fetches the current price for a given coin ID."""
+        """
+        Fetches the current price for a given coin ID.
+
+        Deprecated: use `get_prices_by_coin_ids`, which fetches many coins in
+        one request.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_prices_by_coin_ids(self, coin_ids: List[str]) -> Dict[str, float]:
+        """
+        Fetches current prices for many coin IDs in as few requests as the
+        provider allows. IDs without a price are omitted from the result.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -0,0 +1,32 @@
+"""
+Helpers for screening coins against the candidate thresholds.
+"""
+from typing import List
+
+import numpy as np
+
+from domain.models.coin import Coin
+
+
+def select_candidates(coins: List[Coin], min_price_change: float) -> List[Coin]:
+    """
+    Returns the coins whose price change meets `min_price_change`.
+
+    The price changes are packed into a single float array so the threshold
+    check runs as one vectorized comparison instead of a Python loop over
+    every stored coin.
+
+    Args:
+        coins: The coins to screen.
+        min_price_change: The minimum price change for a candidate.
+
+    Returns:
+        The candidate coins, in their original order.
+    """
+    if not coins:
+        return []
+
+    price_changes = np.fromiter(
+        (coin.price_change for coin in coins), dtype=np.float64, count=len(coins)
+    )
+    return [coins[i] for i in np.flatnonzero(price_changes >= min_price_change)]
@@ -3,10 +3,12 @@ Encapsulates the trading strategy logic.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
 from domain.components.strategy_component import StrategyComponent
+from domain.exits import select_exit_orders
 from domain.models.coin import Coin
+from domain.models.paper_order import PaperOrder
 from domain.trading_service import TradingService
 from utils.load_env import Settings
 from utils.logger import get_logger
@@ -38,7 +40,7 @@ class Strategy(StrategyComponent):
     def evaluate_and_execute_buy(self, coin: Coin, current_price: float, safe_pools: list):
         """Evaluates and executes a buy order if the strategy conditions are met."""
         context = {
-            "coin": coin.to_dict(),
+            "coin": coin.to_context_dict(self.config.prompt_price_rows),
             "pools": safe_pools,
             "price_change": coin.price_change,
         }
@@ -85,37 +87,42 @@ class Strategy(StrategyComponent):
             order.direction,
         )
 
-    def evaluate_and_execute_sell(self, coin: Coin, current_price: float):
-        """Evaluates and executes a sell order if the strategy conditions are met."""
-        buy_orders = self.storage.get_all_orders("BUY")
-        filtered_buy_orders = [
-            order for order in buy_orders if order.symbol == coin.symbol
-        ]
-        if not filtered_buy_orders:
+    def evaluate_and_execute_sell(
+        self,
+        coin: Coin,
+        current_price: float,
+        buy_orders: Optional[List[PaperOrder]] = None,
+    ):
+        """
+        Evaluates and executes a sell order if the strategy conditions are met.
+
+        `buy_orders` are the coin's open BUY orders, pre-indexed once per
+        cycle by the engine. When omitted they are loaded from storage.
+        """
+        if buy_orders is None:
+            buy_orders = [
+                order
+                for order in self.storage.get_all_orders("BUY")
+                if order.symbol == coin.symbol
+            ]
+        if not buy_orders:
             return
 
-        for order in filtered_buy_orders:
-            stop_loss_price = order.buy_price * (1 - self.config.trade.stop_loss / 100)
-            take_profit_price = order.buy_price * (
-                1 + self.config.trade.take_profit / 100
+        for order, stop_loss_hit, current_pnl in select_exit_orders(
+            buy_orders, current_price, self.config.trade
+        ):
+            sell_order = TradingService.sell(
+                order.symbol, current_price, order.quantity
             )
-            current_pnl = (current_price - order.buy_price) / order.buy_price * 100
-
-            if current_price <= stop_loss_price or current_price >= take_profit_price:
-                sell_order = TradingService.sell(
-                    order.symbol, current_price, order.quantity
-                )
-                trigger = (
-                    "Stop Loss" if current_price <= stop_loss_price else "Take Profit"
-                )
-                logger.info(
-                    f"{trigger} Triggered: Sold {order.quantity} of {order.symbol} at ${current_price}"
-                )
-                self.storage.insert_order(
-                    sell_order.timestamp,
-                    sell_order.buy_price,
-                    sell_order.quantity,
-                    sell_order.symbol,
-                    sell_order.direction,
-                )
-                self.storage.update_coin_pnl(order.symbol, current_pnl)
+            trigger = "Stop Loss" if stop_loss_hit else "Take Profit"
+            logger.info(
+                f"{trigger} Triggered: Sold {order.quantity} of {order.symbol} at ${current_price}"
+            )
+            self.storage.insert_order(
+                sell_order.timestamp,
+                sell_order.buy_price,
+                sell_order.quantity,
+                sell_order.symbol,
+                sell_order.direction,
+            )
+            self.storage.update_coin_pnl(order.symbol, current_pnl)
@@ -37,7 +37,7 @@ class TradingService:
         new_total_quantity = total_qty + new_order_qty
 
         if new_total_quantity == 0:
-            return 0  # If all quantities are sold, cost basis resets
+            return 0.0  # If all quantities are sold, cost basis resets
 
         return (
             (current_cost_basis * total_qty) + (new_order_price * new_order_qty)
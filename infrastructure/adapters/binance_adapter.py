@@ -61,6 +61,25 @@ class BinanceAdapter(MarketDataPort):
             logger.error(f"BinanceAdapter: Unexpected error fetching price for {coin_id}: {e}")
             return None
 
+    def get_prices_by_coin_ids(self, coin_ids: List[str]) -> Dict[str, float]:
+        logger.debug(f"BinanceAdapter: Fetching prices for {len(coin_ids)} coins")
+        try:
+            # Without a symbol, the ticker endpoint returns every pair at once.
+            tickers = self._get_retrying_api_call(self.client.get_symbol_ticker)()
+            by_symbol = {ticker['symbol']: ticker['price'] for ticker in tickers}
+            prices: Dict[str, float] = {}
+            for coin_id in coin_ids:
+                price = by_symbol.get(coin_id.upper() + 'USDT')
+                if price is not None:
+                    prices[coin_id] = float(price)
+            return prices
+        except (BinanceAPIException, requests.exceptions.RequestException) as e:
+            logger.error(f"BinanceAdapter: Error fetching prices: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"BinanceAdapter: Unexpected error fetching prices: {e}")
+            return {}
+
     def get_historic_ohlc_by_coin_id(
         self,
         coin_id: str,
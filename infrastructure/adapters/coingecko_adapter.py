@@ -6,8 +6,10 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -22,6 +24,10 @@ from utils.logger import get_logger  # Moved to top
 
 logger = get_logger(__name__)
 
+# Maximum number of ids sent in a single /simple/price request, keeping the
+# query string well under common URL length limits.
+PRICE_IDS_PER_REQUEST = 250
+
 
 class CoinGeckoAdapter(MarketDataPort):
     """An adapter for the CoinGecko API that implements the MarketDataPort."""
@@ -33,6 +39,15 @@ class CoinGeckoAdapter(MarketDataPort):
             "accept": "application/json",
             "x-cg-demo-api-key": self.config.cg_api_key,
         }
+        # One keep-alive session for every request, so calls reuse pooled
+        # TCP/TLS connections instead of handshaking each time. The pool is
+        # sized for the engine's concurrent pool lookups.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=max(1, self.config.api.max_concurrency)),
+        )
         logger.info("CoinGecko adapter initialized.")
 
     def _get_retrying_api_call(self, api_call_func):
@@ -54,16 +69,16 @@ class CoinGeckoAdapter(MarketDataPort):
         request_url = f"{self.root}/simple/price?ids={coin_id}&vs_currencies=usd"
         start_time = time.monotonic()
         try:
-            response = self._get_retrying_api_call(requests.get)(request_url, headers=self.headers, timeout=self.config.api.request_timeout)
+            response = self._get_retrying_api_call(self.session.get)(request_url, timeout=self.config.api.request_timeout)
             response.raise_for_status()
             duration = time.monotonic() - start_time
             logger.info(
                 "CoinGecko API call successful",
                 extra={"event": "api_call", "adapter": "coingecko", "endpoint": "/simple/price", "duration_ms": duration * 1000},
             )
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get(coin_id, {}).get("usd")  # type: ignore[no-any-return]
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             duration = time.monotonic() - start_time
             logger.error(
                 f"CoinGecko API request failed for price of {coin_id}: {e}",
@@ -71,6 +86,34 @@ class CoinGeckoAdapter(MarketDataPort):
             )
             return None
 
+    def get_prices_by_coin_ids(self, coin_ids: List[str]) -> Dict[str, float]:
+        prices: Dict[str, float] = {}
+        for start in range(0, len(coin_ids), PRICE_IDS_PER_REQUEST):
+            chunk = coin_ids[start : start + PRICE_IDS_PER_REQUEST]
+            request_url = (
+                f"{self.root}/simple/price?ids={','.join(chunk)}&vs_currencies=usd"
+            )
+            start_time = time.monotonic()
+            try:
+                response = self._get_retrying_api_call(self.session.get)(request_url, timeout=self.config.api.request_timeout)
+                response.raise_for_status()
+                duration = time.monotonic() - start_time
+                logger.info(
+                    "CoinGecko API call successful",
+                    extra={"event": "api_call", "adapter": "coingecko", "endpoint": "/simple/price", "duration_ms": duration * 1000},
+                )
+                for coin_id, quote in orjson.loads(response.content).items():
+                    price = quote.get("usd")
+                    if price is not None:
+                        prices[coin_id] = price
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                duration = time.monotonic() - start_time
+                logger.error(
+                    f"CoinGecko API request failed for prices of {len(chunk)} coins: {e}",
+                    extra={"event": "api_error", "adapter": "coingecko", "endpoint": "/simple/price", "duration_ms": duration * 1000},
+                )
+        return prices
+
     def get_historic_ohlc_by_coin_id(
         self,
         coin_id: str,
@@ -83,15 +126,15 @@ class CoinGeckoAdapter(MarketDataPort):
         request_url = f"{self.root}/coins/{coin_id}/ohlc?vs_currency={vs_currency}&days={days}"
         start_time = time.monotonic()
         try:
-            response = self._get_retrying_api_call(requests.get)(request_url, headers=self.headers, timeout=self.config.api.request_timeout)
+            response = self._get_retrying_api_call(self.session.get)(request_url, timeout=self.config.api.request_timeout)
             response.raise_for_status()
             duration = time.monotonic() - start_time
             logger.info(
                 "CoinGecko API call successful",
                 extra={"event": "api_call", "adapter": "coingecko", "endpoint": "/coins/{id}/ohlc", "duration_ms": duration * 1000},
             )
-            return response.json()  # type: ignore[no-any-return]
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)  # type: ignore[no-any-return]
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             duration = time.monotonic() - start_time
             logger.error(
                 f"CoinGecko API request failed for OHLC of {coin_id}: {e}",
@@ -127,28 +170,26 @@ class CoinGeckoAdapter(MarketDataPort):
         )
         start_time = time.monotonic()
         try:
-            response = self._get_retrying_api_call(requests.get)(request_url, headers=self.headers, timeout=self.config.api.request_timeout)
+            response = self._get_retrying_api_call(self.session.get)(request_url, timeout=self.config.api.request_timeout)
             response.raise_for_status()
             duration = time.monotonic() - start_time
             logger.info(
                 "CoinGecko API call successful",
                 extra={"event": "api_call", "adapter": "coingecko", "endpoint": "/coins/markets", "duration_ms": duration * 1000},
             )
-            data = response.json()
-            coins = []
             now = datetime.now().timestamp()
-            for coin_data in data:
-                coin = Coin(
+            return [
+                Coin(
                     coin_id=coin_data["id"],
                     symbol=coin_data["symbol"],
                     realized_pnl=0.0,
+                    prices=[[now, coin_data["current_price"]]],
                     price_change=coin_data.get("price_change_percentage_1h_in_currency")
                     or 0.0,
                 )
-                coin.prices = [[now, coin_data["current_price"]]]
-                coins.append(coin)
-            return coins
-        except requests.exceptions.RequestException as e:
+                for coin_data in orjson.loads(response.content)
+            ]
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             duration = time.monotonic() - start_time
             logger.error(
                 f"CoinGecko API request failed for market data: {e}",
@@ -164,15 +205,15 @@ class CoinGeckoAdapter(MarketDataPort):
             request_url += f"&chain={chain}"
         start_time = time.monotonic()
         try:
-            response = self._get_retrying_api_call(requests.get)(request_url, headers=self.headers, timeout=self.config.api.request_timeout)
+            response = self._get_retrying_api_call(self.session.get)(request_url, timeout=self.config.api.request_timeout)
             response.raise_for_status()
             duration = time.monotonic() - start_time
             logger.info(
                 "CoinGecko API call successful",
                 extra={"event": "api_call", "adapter": "coingecko", "endpoint": "/onchain/search/pools", "duration_ms": duration * 1000},
             )
-            return response.json()  # type: ignore[no-any-return]
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)  # type: ignore[no-any-return]
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             duration = time.monotonic() - start_time
             logger.error(
                 f"CoinGecko API request failed for pool search: {e}",
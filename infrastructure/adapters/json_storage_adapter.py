@@ -1,12 +1,31 @@
 """
 Adapter for storing and retrieving trading data from JSON files.
+
+Coins and portfolio items are stored as JSON arrays. Orders are append-only,
+so they are stored as newline-delimited JSON (one order object per line) and
+new orders are appended instead of rewriting the whole file.
 """
 from __future__ import annotations
 
-import json
+import itertools
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, cast, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import orjson
 
 from domain.models.coin import Coin
 from domain.models.paper_order import PaperOrder
@@ -16,6 +35,12 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+# A buffered write to one record: maps the record as it currently is (None
+# if absent) to its new value, or None to leave it unchanged.
+_RecordUpdate = Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+
 
 class JSONStorageAdapter(DataStoragePort):
     """
@@ -27,33 +52,236 @@ class JSONStorageAdapter(DataStoragePort):
         self.coins_file = coins_file
         self.orders_file = orders_file
         self.portfolio_file = portfolio_file
+        # Parsed file contents keyed by path, tagged with the (mtime_ns, size)
+        # they were parsed at so unchanged files are not re-read.
+        self._cache: Dict[str, Tuple[Tuple[int, int], List[Any]]] = {}
+        # Writes buffered by an open transaction(), flushed once on exit: the
+        # snapshot later reads inside the transaction see, and the per-symbol
+        # updates that produced it, replayed on the current file at flush.
+        self._pending: Dict[str, List[Any]] = {}
+        self._pending_updates: Dict[str, List[Tuple[str, _RecordUpdate]]] = {}
+        # Order lines appended inside an open transaction(), written on exit.
+        self._pending_orders: List[bytes] = []
+        self._transaction_depth = 0
+        # Guards the buffers above and each read-modify-write, since the
+        # engine's shadow-evaluation threads share this adapter.
+        self._lock = threading.RLock()
+        # {symbol: position} indexes, each bound to the exact list it indexes.
+        self._indexes: Dict[str, Tuple[List[Any], Dict[str, int]]] = {}
         logger.info(
             "JSON Storage Adapter initialized with files: "
             f"{coins_file}, {orders_file}, {portfolio_file}"
         )
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Buffers every write made inside the block in memory and rewrites each
+        touched file once when the outermost block exits, instead of once per
+        insert/update call.
+
+        The buffered per-symbol updates are replayed on the file as it is at
+        flush time, so records another process (e.g. the Celery price tasks)
+        wrote while the block was open are kept rather than overwritten.
+        """
+        with self._lock:
+            self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self._pending = {}
+                    pending_updates, self._pending_updates = self._pending_updates, {}
+                    for file_path, updates in pending_updates.items():
+                        self._flush_updates(file_path, updates)
+                    pending_orders, self._pending_orders = self._pending_orders, []
+                    if pending_orders:
+                        self._append_lines(self.orders_file, pending_orders)
+
     # --- Private Helper Methods ---
 
     def _read_data(self, file_path: str) -> List[Any]:
-        if not os.path.exists(file_path):
+        if file_path in self._pending:
+            return self._pending[file_path]
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._cache.pop(file_path, None)
             return []
+        except OSError as e:
+            logger.error(f"Error reading from {file_path}: {e}")
+            return []
+
+        # Size is part of the key because mtime resolution can be coarser
+        # than the interval between two writes.
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         try:
-            with open(file_path, "r") as f:
-                data = f.read().strip()
-                if not data:
-                    return []
-                return cast(List[Any], json.loads(data))
-        except (IOError, json.JSONDecodeError) as e:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            items = cast(List[Any], orjson.loads(data)) if data.strip() else []
+        except (IOError, orjson.JSONDecodeError) as e:
             logger.error(f"Error reading from {file_path}: {e}")
             return []
+        self._cache[file_path] = (version, items)
+        return items
+
+    def _flush_updates(
+        self, file_path: str, updates: List[Tuple[str, _RecordUpdate]]
+    ) -> None:
+        """Applies buffered per-symbol updates to the current file contents."""
+        current = self._read_data(file_path)
+        index = dict(self._symbol_index(file_path, current))
+        items = list(current)
+        for symbol, update in updates:
+            position = index.get(symbol)
+            if position is None:
+                record = update(None)
+                if record is not None:
+                    index[symbol] = len(items)
+                    items.append(record)
+            else:
+                record = update(items[position])
+                if record is not None:
+                    items[position] = record
+        self._indexes[file_path] = (items, index)
+        self._flush(file_path, items)
+
+    def _flush(self, file_path: str, items: List[Any]):
+        """Atomically replaces `file_path` with the serialized items."""
+        tmp_path = f"{file_path}.tmp"
+        try:
+            payload = orjson.dumps(items, default=str, option=_ORJSON_OPTIONS)
+            self._cache.pop(file_path, None)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+            # What we just wrote is what the next read would parse.
+            stat = os.stat(file_path)
+            self._cache[file_path] = ((stat.st_mtime_ns, stat.st_size), items)
+        except (IOError, orjson.JSONEncodeError) as e:
+            logger.error(f"Error writing to {file_path}: {e}")
 
-    def _write_data(self, file_path: str, items: List[Any]):
+    def _append_lines(self, file_path: str, lines: List[bytes]):
+        """Appends NDJSON lines to `file_path` in a single write."""
         try:
-            with open(file_path, "w") as f:
-                f.write(json.dumps(items, default=str))
+            with open(file_path, "ab") as f:
+                f.write(b"".join(lines))
         except IOError as e:
             logger.error(f"Error writing to {file_path}: {e}")
 
+    def _buffered_orders(self) -> List[bytes]:
+        """Returns the order lines buffered by an open transaction()."""
+        with self._lock:
+            return list(self._pending_orders)
+
+    def _read_lines(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the objects stored in an NDJSON file, one line at a time.
+        Blank lines and lines that fail to parse (e.g. a write cut short by a
+        crash) are skipped.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(
+                            f"Skipping malformed line {line_number} in {file_path}: {e}"
+                        )
+        except FileNotFoundError:
+            return
+        except IOError as e:
+            logger.error(f"Error reading from {file_path}: {e}")
+
+    def _symbol_index(self, file_path: str, items: List[Any]) -> Dict[str, int]:
+        """
+        Returns a {symbol: position} index for `items`, building it only when
+        the file's contents have changed since it was last indexed.
+        """
+        indexed = self._indexes.get(file_path)
+        if indexed is not None and indexed[0] is items:
+            return indexed[1]
+        index: Dict[str, int] = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.get("symbol"), position)
+        self._indexes[file_path] = (items, index)
+        return index
+
+    def _find_by_symbol(self, file_path: str, symbol: str) -> Optional[Dict[str, Any]]:
+        items = self._read_data(file_path)
+        position = self._symbol_index(file_path, items).get(symbol)
+        return None if position is None else cast(Dict[str, Any], items[position])
+
+    def _replace_items(
+        self,
+        file_path: str,
+        items: List[Any],
+        index: Dict[str, int],
+        symbol: str,
+        update: _RecordUpdate,
+    ) -> None:
+        """
+        Writes `items`, carrying over an index that is still valid for it.
+        Inside a transaction the write is buffered along with the `update`
+        to `symbol` that produced it.
+        """
+        self._indexes[file_path] = (items, index)
+        if self._transaction_depth:
+            self._pending[file_path] = items
+            self._pending_updates.setdefault(file_path, []).append((symbol, update))
+            return
+        self._flush(file_path, items)
+
+    def _append_by_symbol(self, file_path: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            items = self._read_data(file_path)
+            index = self._symbol_index(file_path, items)
+            index.setdefault(record["symbol"], len(items))
+            self._replace_items(
+                file_path,
+                items + [record],
+                index,
+                record["symbol"],
+                lambda current: record if current is None else None,
+            )
+
+    def _update_by_symbol(
+        self,
+        file_path: str,
+        symbol: str,
+        update: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Replaces the record for `symbol` with `update(record)` and returns the
+        new record, or None if there is no such symbol. Cached records are
+        never mutated in place.
+        """
+        with self._lock:
+            items = self._read_data(file_path)
+            index = self._symbol_index(file_path, items)
+            position = index.get(symbol)
+            if position is None:
+                return None
+            updated_items = list(items)
+            updated_items[position] = update(items[position])
+            self._replace_items(
+                file_path,
+                updated_items,
+                index,
+                symbol,
+                lambda current: None if current is None else update(current),
+            )
+            return cast(Dict[str, Any], updated_items[position])
+
     # --- Coin Methods ---
 
     def get_all_coins(self) -> List[Coin]:
@@ -61,7 +289,8 @@ class JSONStorageAdapter(DataStoragePort):
         return [Coin.from_dict(c) for c in data]
 
     def get_coin_by_symbol(self, symbol: str) -> Optional[Coin]:
-        return next((c for c in self.get_all_coins() if c.symbol == symbol), None)
+        coin_data = self._find_by_symbol(self.coins_file, symbol)
+        return None if coin_data is None else Coin.from_dict(coin_data)
 
     def add_coin(
         self,
@@ -70,64 +299,61 @@ class JSONStorageAdapter(DataStoragePort):
         realized_pnl: float = 0.0,
         price_change: float = 0.0,
     ) -> Optional[Coin]:
-        coins = self.get_all_coins()
-        if any(c.symbol == symbol for c in coins):
+        if self._find_by_symbol(self.coins_file, symbol) is not None:
             logger.warning(f"Coin '{symbol}' already exists. Cannot add duplicate.")
             return None
-        new_coin = Coin(
+        new_coin_data = Coin(
             symbol=symbol,
             coin_id=coin_id,
             realized_pnl=realized_pnl,
             prices=[],
             price_change=price_change,
-        )
-        coins.append(new_coin)
-        self._write_data(self.coins_file, [c.to_dict() for c in coins])
-        return new_coin
+        ).to_dict()
+        self._append_by_symbol(self.coins_file, new_coin_data)
+        return Coin.from_dict(new_coin_data)
 
     def add_prices_to_coin(
         self, symbol: str, prices: List[list]
     ) -> Optional[List[list]]:
-        coins = self.get_all_coins()
-        for coin in coins:
-            if coin.symbol == symbol:
-                coin.prices.extend(prices)
-                self._write_data(self.coins_file, [c.to_dict() for c in coins])
-                return prices
-        return None
+        coin_data = self._update_by_symbol(
+            self.coins_file,
+            symbol,
+            lambda c: {**c, "prices": c.get("prices", []) + list(prices)},
+        )
+        return None if coin_data is None else prices
 
     def update_coin_price_change(
-        self, symbol: str, price_change: float
-    ) -> Optional[Coin]:
-        coins = self.get_all_coins()
-        for coin in coins:
-            if coin.symbol == symbol:
-                coin.price_change = price_change
-                self._write_data(self.coins_file, [c.to_dict() for c in coins])
-                return coin
-        return None
-
-    def update_coin_pnl(self, symbol: str, new_realized_pnl: float) -> Optional[Coin]:
-        coins = self.get_all_coins()
-        for coin in coins:
-            if coin.symbol == symbol:
-                coin.realized_pnl = new_realized_pnl
-                break
-        else:
-            return None
-        self._write_data(self.coins_file, [c.to_dict() for c in coins])
-        return coin
+        self, symbol: str, price_change: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
+        coin_data = self._update_by_symbol(
+            self.coins_file, symbol, lambda c: {**c, "priceChange": price_change}
+        )
+        if coin_data is None:
+            return None if fetch else False
+        return Coin.from_dict(coin_data) if fetch else True
+
+    def update_coin_pnl(
+        self, symbol: str, new_realized_pnl: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
+        coin_data = self._update_by_symbol(
+            self.coins_file, symbol, lambda c: {**c, "realizedPnl": new_realized_pnl}
+        )
+        if coin_data is None:
+            return None if fetch else False
+        return Coin.from_dict(coin_data) if fetch else True
 
     # --- Order Methods ---
 
     def get_all_orders(
         self, direction: Optional[Literal["BUY", "SELL"]] = None
-    ) -> List[PaperOrder]:
-        data = self._read_data(self.orders_file)
-        orders = [PaperOrder.from_dict(o) for o in data]
-        if direction:
-            orders = [o for o in orders if o.direction == direction]
-        return orders
+    ) -> Iterator[PaperOrder]:
+        records = itertools.chain(
+            self._read_lines(self.orders_file),
+            (orjson.loads(line) for line in self._buffered_orders()),
+        )
+        for record in records:
+            if direction is None or record.get("direction") == direction:
+                yield PaperOrder.from_dict(record)
 
     def insert_order(
         self,
@@ -137,7 +363,6 @@ class JSONStorageAdapter(DataStoragePort):
         symbol: str,
         direction: Literal["BUY", "SELL"],
     ) -> PaperOrder:
-        orders = self.get_all_orders()
         new_order = PaperOrder(
             timestamp=timestamp,
             buy_price=buy_price,
@@ -145,8 +370,15 @@ class JSONStorageAdapter(DataStoragePort):
             symbol=symbol,
             direction=direction,
         )
-        orders.append(new_order)
-        self._write_data(self.orders_file, [o.to_dict() for o in orders])
+        line = (
+            orjson.dumps(new_order.to_dict(), default=str, option=_ORJSON_OPTIONS)
+            + b"\n"
+        )
+        with self._lock:
+            if self._transaction_depth:
+                self._pending_orders.append(line)
+            else:
+                self._append_lines(self.orders_file, [line])
         return new_order
 
     # --- Portfolio Methods ---
@@ -156,42 +388,42 @@ class JSONStorageAdapter(DataStoragePort):
         return [PortfolioItem.from_dict(p) for p in data]
 
     def get_portfolio_item_by_symbol(self, symbol: str) -> Optional[PortfolioItem]:
-        return next(
-            (item for item in self.get_all_portfolio_items() if item.symbol == symbol),
-            None,
-        )
+        item_data = self._find_by_symbol(self.portfolio_file, symbol)
+        return None if item_data is None else PortfolioItem.from_dict(item_data)
 
     def insert_portfolio_item(
         self, symbol: str, cost_basis: float, total_quantity: float
     ) -> PortfolioItem:
-        items = self.get_all_portfolio_items()
         new_item = PortfolioItem(
             symbol=symbol, cost_basis=cost_basis, total_quantity=total_quantity
         )
-        items.append(new_item)
-        self._write_data(self.portfolio_file, [i.to_dict() for i in items])
+        self._append_by_symbol(self.portfolio_file, new_item.to_dict())
         return new_item
 
     def update_portfolio_item_by_symbol(
         self, symbol: str, cost_basis: float, additional_quantity: float
     ) -> Optional[PortfolioItem]:
-        items = self.get_all_portfolio_items()
-        for item in items:
-            if item.symbol == symbol:
-                item.cost_basis = cost_basis
-                item.total_quantity += additional_quantity
-                self._write_data(self.portfolio_file, [i.to_dict() for i in items])
-                return item
-        return None
+        item_data = self._update_by_symbol(
+            self.portfolio_file,
+            symbol,
+            lambda p: {
+                **p,
+                "cost_basis": cost_basis,
+                "total_quantity": p["total_quantity"] + additional_quantity,
+            },
+        )
+        return None if item_data is None else PortfolioItem.from_dict(item_data)
 
     def add_pnl_entry_by_symbol(
         self, symbol: str, date: datetime, value: float
     ) -> Optional[PnLEntry]:
-        items = self.get_all_portfolio_items()
-        for item in items:
-            if item.symbol == symbol:
-                pnl_entry = PnLEntry(date=date, value=value)
-                item.pnl_entries.append(pnl_entry)
-                self._write_data(self.portfolio_file, [i.to_dict() for i in items])
-                return pnl_entry
-        return None
+        pnl_entry = PnLEntry(date=date, value=value)
+        item_data = self._update_by_symbol(
+            self.portfolio_file,
+            symbol,
+            lambda p: {
+                **p,
+                "pnl_entries": p.get("pnl_entries", []) + [pnl_entry.to_dict()],
+            },
+        )
+        return None if item_data is None else pnl_entry
@@ -37,6 +37,26 @@ class MultiMarketDataAdapter(MarketDataPort):
         logger.warning(f"Could not fetch price for {coin_id} from any adapter.")
         return None
 
+    def get_prices_by_coin_ids(self, coin_ids: List[str]) -> Dict[str, float]:
+        prices: Dict[str, float] = {}
+        for adapter in self.adapters:
+            missing = [coin_id for coin_id in coin_ids if coin_id not in prices]
+            if not missing:
+                break
+            try:
+                fetched = adapter.get_prices_by_coin_ids(missing)
+                logger.debug(
+                    f"Prices for {len(fetched)}/{len(missing)} coins fetched from {adapter.__class__.__name__}"
+                )
+                prices.update(fetched)
+            except Exception as e:
+                logger.warning(f"Failed to get prices from {adapter.__class__.__name__}: {e}")
+        if len(prices) < len(coin_ids):
+            logger.warning(
+                f"Could not fetch prices for {len(coin_ids) - len(prices)} coins from any adapter."
+            )
+        return prices
+
     def get_historic_ohlc_by_coin_id(
         self,
         coin_id: str,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import time
 from typing import Any, Dict
 
+import orjson
 from openai import APIError, OpenAI
 from tenacity import (
     retry,
@@ -25,7 +26,10 @@ class OpenAIAdapter(DecisionEnginePort):
 
     def __init__(self, config: Settings):
         self.config = config
-        self.client = OpenAI(api_key=self.config.openai_api_key)
+        self.client = OpenAI(
+            api_key=self.config.openai_api_key,
+            timeout=self.config.api.request_timeout,
+        )
         logger.info("OpenAI adapter initialized.")
 
     def _get_retrying_api_call(self, api_call_func):
@@ -51,13 +55,19 @@ class OpenAIAdapter(DecisionEnginePort):
         """
         start_time = time.monotonic()
         try:
-            logger.debug(f"Sending context to OpenAI: {context}")
+            logger.debug("Sending context to OpenAI: %s", context)
             response = self._get_retrying_api_call(self.client.chat.completions.create)(
                 model=model,
                 messages=[
                     {"role": "system", "content": instructions},
-                    {"role": "user", "content": str(context)},
+                    {
+                        "role": "user",
+                        "content": orjson.dumps(
+                            context, default=str, option=orjson.OPT_SERIALIZE_NUMPY
+                        ).decode(),
+                    },
                 ],
+                max_completion_tokens=self.config.openai_max_tokens,
             )
             duration = time.monotonic() - start_time
             recommendation = response.choices[0].message.content
@@ -70,7 +80,7 @@ class OpenAIAdapter(DecisionEnginePort):
                     "duration_ms": duration * 1000,
                 },
             )
-            logger.debug(f"Received recommendation from OpenAI: {recommendation}")
+            logger.debug("Received recommendation from OpenAI: %s", recommendation)
             return recommendation or "NEUTRAL"
         except APIError as e:
             duration = time.monotonic() - start_time
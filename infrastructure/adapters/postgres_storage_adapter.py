@@ -3,12 +3,14 @@ PostgreSQL adapter for data storage services.
 """
 from __future__ import annotations
 
+import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Iterator, List, Literal, Optional, Union
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 from domain.models.coin import Coin
 from domain.models.paper_order import PaperOrder
@@ -19,21 +21,50 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# libpq TCP keepalive options. They stop idle pooled connections from being
+# silently dropped by the server or a NAT/load balancer, which would otherwise
+# force a burst of reconnects (TCP + TLS + auth) on the next trading cycle.
+KEEPALIVE_OPTIONS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 5,
+    "tcp_user_timeout": 30000,
+}
+
+# Rows sent per INSERT statement by execute_values. The psycopg2 default of
+# 100 turns a large OHLC backfill into many round trips.
+INSERT_PAGE_SIZE = 1000
+
+# Rows fetched per round trip by the server-side (named) cursors used to
+# stream large tables.
+STREAM_ITERSIZE = 1000
+
 
 class PostgreSQLStorageAdapter(DataStoragePort):
     """
     A concrete implementation of DataStoragePort for PostgreSQL.
+
+    Connections are kept warm in a thread-safe pool so the handshake cost is
+    paid once per connection rather than once per query. When running more
+    than ~10 bot/worker processes against the same database, put pgbouncer in
+    front of it in `transaction` pooling mode and point DB_HOST/DB_PORT at
+    pgbouncer; psycopg2 does not use server-side prepared statements, so no
+    extra statement-caching configuration is required.
     """
 
     def __init__(self, db_settings: DBSettings):
-        self.pool = SimpleConnectionPool(
-            minconn=1,
-            maxconn=db_settings.max_pool_connections,
+        maxconn = db_settings.max_pool_connections
+        minconn = min(max(2, os.cpu_count() or 1), maxconn)
+        self.pool = ThreadedConnectionPool(
+            minconn=minconn,
+            maxconn=maxconn,
             host=db_settings.host,
             port=db_settings.port,
             user=db_settings.user,
             password=db_settings.password,
             dbname=db_settings.dbname,
+            **KEEPALIVE_OPTIONS,
         )
         self.initialize_database()
         logger.info("PostgreSQLStorageAdapter initialized.")
@@ -55,6 +86,14 @@ class PostgreSQLStorageAdapter(DataStoragePort):
                 finally:
                     self.pool.putconn(conn)
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Each statement already commits on its own pooled connection, so there
+        is nothing to buffer; this exists to satisfy the storage port.
+        """
+        yield
+
     def get_all_coins(self) -> List[Coin]:
         with self.pool.getconn() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -121,16 +160,18 @@ class PostgreSQLStorageAdapter(DataStoragePort):
         with self.pool.getconn() as conn:
             with conn.cursor() as cur:
                 try:
-                    args_list = [
-                        (coin.id, p[0], p[1], p[2], p[3], p[4]) for p in prices
-                    ]
-                    psycopg2.extras.execute_values(
+                    # A generator avoids materializing a second copy of the
+                    # price list; execute_values consumes it page by page.
+                    rows = ((coin.id, p[0], p[1], p[2], p[3], p[4]) for p in prices)
+                    execute_values(
                         cur,
                         """
                         INSERT INTO prices (coin_id, timestamp, open, high, low, close)
                         VALUES %s;
                         """,
-                        args_list,
+                        rows,
+                        template="(%s, %s, %s, %s, %s, %s)",
+                        page_size=INSERT_PAGE_SIZE,
                     )
                     conn.commit()
                     return prices
@@ -142,11 +183,21 @@ class PostgreSQLStorageAdapter(DataStoragePort):
                     self.pool.putconn(conn)
 
     def update_coin_price_change(
-        self, symbol: str, price_change: float
-    ) -> Optional[Coin]:
+        self, symbol: str, price_change: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
         with self.pool.getconn() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 try:
+                    if not fetch:
+                        # Skip RETURNING * when the caller only needs to know
+                        # whether a row matched; avoids shipping and decoding
+                        # the full row on every tick.
+                        cur.execute(
+                            "UPDATE coins SET price_change = %s WHERE symbol = %s;",
+                            (price_change, symbol),
+                        )
+                        conn.commit()
+                        return cur.rowcount > 0
                     cur.execute(
                         """
                         UPDATE coins
@@ -164,14 +215,23 @@ class PostgreSQLStorageAdapter(DataStoragePort):
                 except psycopg2.Error as e:
                     logger.error(f"Error updating price change for coin {symbol}: {e}")
                     conn.rollback()
-                    return None
+                    return None if fetch else False
                 finally:
                     self.pool.putconn(conn)
 
-    def update_coin_pnl(self, symbol: str, new_realized_pnl: float) -> Optional[Coin]:
+    def update_coin_pnl(
+        self, symbol: str, new_realized_pnl: float, fetch: bool = False
+    ) -> Union[Coin, bool, None]:
         with self.pool.getconn() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 try:
+                    if not fetch:
+                        cur.execute(
+                            "UPDATE coins SET realized_pnl = %s WHERE symbol = %s;",
+                            (new_realized_pnl, symbol),
+                        )
+                        conn.commit()
+                        return cur.rowcount > 0
                     cur.execute(
                         """
                         UPDATE coins
@@ -189,27 +249,50 @@ class PostgreSQLStorageAdapter(DataStoragePort):
                 except psycopg2.Error as e:
                     logger.error(f"Error updating PNL for coin {symbol}: {e}")
                     conn.rollback()
-                    return None
+                    return None if fetch else False
                 finally:
                     self.pool.putconn(conn)
 
     def get_all_orders(
         self, direction: Optional[Literal["BUY", "SELL"]] = None
-    ) -> List[PaperOrder]:
-        with self.pool.getconn() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                try:
+    ) -> Iterator[PaperOrder]:
+        """
+        Streams orders through a server-side cursor, so memory stays bounded
+        by STREAM_ITERSIZE however long the order history grows. The pooled
+        connection is held until the generator is exhausted or closed.
+        """
+        conn = self.pool.getconn()
+        try:
+            # The named cursor is closed and the transaction ended before the
+            # connection goes back to the pool, never after.
+            with conn:
+                with conn.cursor(
+                    name="orders_stream", cursor_factory=RealDictCursor
+                ) as cur:
+                    cur.itersize = STREAM_ITERSIZE
+                    # Select the PaperOrder fields explicitly; the table's `id`
+                    # column has no counterpart on the model.
                     if direction:
-                        cur.execute("SELECT * FROM orders WHERE direction = %s;", (direction,))
+                        cur.execute(
+                            """
+                            SELECT timestamp, buy_price, quantity, symbol, direction
+                            FROM orders WHERE direction = %s;
+                            """,
+                            (direction,),
+                        )
                     else:
-                        cur.execute("SELECT * FROM orders;")
-                    orders_data = cur.fetchall()
-                    return [PaperOrder(**data) for data in orders_data]
-                except psycopg2.Error as e:
-                    logger.error(f"Error getting all orders: {e}")
-                    return []
-                finally:
-                    self.pool.putconn(conn)
+                        cur.execute(
+                            """
+                            SELECT timestamp, buy_price, quantity, symbol, direction
+                            FROM orders;
+                            """
+                        )
+                    for data in cur:
+                        yield PaperOrder(**data)
+        except psycopg2.Error as e:
+            logger.error(f"Error getting all orders: {e}")
+        finally:
+            self.pool.putconn(conn)
 
     def insert_order(
         self,
@@ -240,18 +323,22 @@ class PostgreSQLStorageAdapter(DataStoragePort):
                 finally:
                     self.pool.putconn(conn)
 
-    def get_all_portfolio_items(self) -> List[PortfolioItem]:
-        with self.pool.getconn() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                try:
+    def get_all_portfolio_items(self) -> Iterator[PortfolioItem]:
+        """Streams portfolio items through a server-side cursor."""
+        conn = self.pool.getconn()
+        try:
+            with conn:
+                with conn.cursor(
+                    name="portfolio_stream", cursor_factory=RealDictCursor
+                ) as cur:
+                    cur.itersize = STREAM_ITERSIZE
                     cur.execute("SELECT * FROM portfolio;")
-                    portfolio_data = cur.fetchall()
-                    return [PortfolioItem(**data) for data in portfolio_data]
-                except psycopg2.Error as e:
-                    logger.error(f"Error getting all portfolio items: {e}")
-                    return []
-                finally:
-                    self.pool.putconn(conn)
+                    for data in cur:
+                        yield PortfolioItem(**data)
+        except psycopg2.Error as e:
+            logger.error(f"Error getting all portfolio items: {e}")
+        finally:
+            self.pool.putconn(conn)
 
     def get_portfolio_item_by_symbol(self, symbol: str) -> Optional[PortfolioItem]:
         with self.pool.getconn() as conn:
@@ -1,10 +1,52 @@
 """
 Factory for creating storage adapters.
 """
+import os
+from functools import lru_cache
+
+from domain.exceptions import DataStorageError
 from domain.ports.data_storage_port import DataStoragePort
 from infrastructure.adapters.json_storage_adapter import JSONStorageAdapter
 from infrastructure.adapters.postgres_storage_adapter import PostgreSQLStorageAdapter
 from utils.load_env import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JSON_COINS_FILE = "data/coins.json"
+JSON_ORDERS_FILE = "data/orders.ndjson"
+JSON_PORTFOLIO_FILE = "data/portfolio.json"
+# Orders store used before orders moved to NDJSON; see migrate_orders.py.
+LEGACY_JSON_ORDERS_FILE = "data/orders.json"
+
+
+def _check_orders_migrated(orders_file: str) -> None:
+    """
+    Refuses to start on an un-migrated orders store, which the adapter would
+    otherwise silently ignore, losing every open position.
+    """
+    if os.path.exists(LEGACY_JSON_ORDERS_FILE) and not os.path.exists(orders_file):
+        message = (
+            f"Found legacy orders file {LEGACY_JSON_ORDERS_FILE} but no "
+            f"{orders_file}. Run `python migrate_orders.py` before starting."
+        )
+        logger.error(message)
+        raise DataStorageError(message)
+
+
+@lru_cache(maxsize=4)
+def _get_json_storage_adapter(
+    coins_file: str, orders_file: str, portfolio_file: str
+) -> JSONStorageAdapter:
+    """
+    Returns one shared adapter per set of files, so its parsed-file cache and
+    symbol indexes survive across callers instead of being rebuilt.
+    """
+    return JSONStorageAdapter(
+        coins_file=coins_file,
+        orders_file=orders_file,
+        portfolio_file=portfolio_file,
+    )
 
 
 def get_storage_adapter(settings: Settings) -> DataStoragePort:
@@ -16,10 +58,9 @@ def get_storage_adapter(settings: Settings) -> DataStoragePort:
     elif settings.storage_provider == "json":
         # This is not ideal, as the JSON adapter needs file paths.
         # This will be fixed in a future step.
-        return JSONStorageAdapter(
-            coins_file="data/coins.json",
-            orders_file="data/orders.json",
-            portfolio_file="data/portfolio.json",
+        _check_orders_migrated(JSON_ORDERS_FILE)
+        return _get_json_storage_adapter(
+            JSON_COINS_FILE, JSON_ORDERS_FILE, JSON_PORTFOLIO_FILE
         )
     else:
         raise ValueError(f"Invalid storage provider: {settings.storage_provider}")
@@ -11,6 +11,7 @@ bot's execution cycle.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 from typing import Iterable
 
@@ -19,15 +20,15 @@ from domain.plugin_loader import load_plugin  # New import
 from infrastructure.adapters.market_data_factory import get_market_data_adapter
 from infrastructure.adapters.openai_adapter import OpenAIAdapter
 from infrastructure.adapters.storage_factory import get_storage_adapter
-from utils.load_env import settings
+from utils.load_env import get_settings
 from utils.logger import get_logger
 from workers.tasks import initialize_coin_data_task
 
 logger = get_logger(__name__)
 
 
-def parse_args(argv: Iterable[str]) -> argparse.Namespace:
-    """Parses command-line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line argument parser."""
     parser = argparse.ArgumentParser(description="AI Crypto Trading Bot")
     parser.add_argument(
         "--interval",
@@ -45,7 +46,16 @@ def parse_args(argv: Iterable[str]) -> argparse.Namespace:
         action="store_true",
         help="Initializes the database with coin data.",
     )
-    return parser.parse_args(list(argv))
+    return parser
+
+
+# Built once at import so repeated parse_args calls reuse it.
+_PARSER = _build_parser()
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    """Parses command-line arguments."""
+    return _PARSER.parse_args(list(argv))
 
 
 def main(argv: Iterable[str] | None = None) -> None:
@@ -59,6 +69,8 @@ def main(argv: Iterable[str] | None = None) -> None:
         print("Database initialization task has been queued.")
         return
 
+    settings = get_settings()
+
     # 1. Initialize Adapters (Infrastructure)
     logger.info("Initializing infrastructure adapters...")
     storage_adapter = get_storage_adapter(settings)
@@ -99,7 +111,7 @@ def main(argv: Iterable[str] | None = None) -> None:
         config=settings,
         loop_interval=args.interval,
     )
-    engine.run(run_once=args.once)
+    asyncio.run(engine.run_async(run_once=args.once))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""
+One-shot migration of the JSON orders store to newline-delimited JSON.
+
+Earlier versions kept every paper order in a single JSON array
+(`data/orders.json`) that was rewritten on each insert. The JSON storage
+adapter now appends orders to `data/orders.ndjson`, one object per line.
+Run this once to carry existing orders over:
+
+    python migrate_orders.py [--source data/orders.json] [--target data/orders.ndjson]
+
+The source file is left in place; delete it once the migration is verified.
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterable
+
+import orjson
+
+from infrastructure.adapters.storage_factory import (
+    JSON_ORDERS_FILE,
+    LEGACY_JSON_ORDERS_FILE,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    """Parses command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--source",
+        default=LEGACY_JSON_ORDERS_FILE,
+        help=f"Legacy JSON array of orders (default: {LEGACY_JSON_ORDERS_FILE}).",
+    )
+    parser.add_argument(
+        "--target",
+        default=JSON_ORDERS_FILE,
+        help=f"NDJSON file to write (default: {JSON_ORDERS_FILE}).",
+    )
+    return parser.parse_args(list(argv))
+
+
+def migrate(source: str, target: str) -> int:
+    """
+    Writes every order in `source` to `target` as NDJSON and returns the
+    number of orders migrated.
+
+    Raises:
+        FileExistsError: If `target` already exists, so a second run cannot
+            duplicate or overwrite orders.
+    """
+    if os.path.exists(target):
+        raise FileExistsError(f"{target} already exists, refusing to overwrite it.")
+
+    with open(source, "rb") as f:
+        data = f.read()
+    orders = orjson.loads(data) if data.strip() else []
+
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(orjson.dumps(order) + b"\n" for order in orders))
+    os.replace(tmp_path, target)
+    return len(orders)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    try:
+        count = migrate(args.source, args.target)
+    except (FileNotFoundError, FileExistsError, orjson.JSONDecodeError) as e:
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+    logger.info(f"Migrated {count} orders from {args.source} to {args.target}.")
@@ -16,15 +16,21 @@ Core Concepts Implemented:
   new defaults for the live trading bot.
 """
 
+import argparse
 import functools
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Tuple
 
 import numpy as np
 import optuna
 import pandas as pd
 import vectorbt as vbt
+from numba import njit
+from vectorbt.generic.nb import crossed_above_1d_nb
 
 from infrastructure.adapters.json_storage_adapter import JSONStorageAdapter
 from utils.logger import get_logger
@@ -35,19 +41,35 @@ logger = get_logger(__name__)
 N_FOLDS = 5  # Number of folds for Walk-Forward Optimization
 TRAIN_TEST_SPLIT = 0.8  # 80% training, 20% testing in each fold
 N_TRIALS = 100  # Number of optimization trials per fold
+PRUNING_STEPS = 4  # Training-window prefixes each trial is scored on
 PARAMS_FILE = "best_params.json"
+# Fold studies persist here so an interrupted run resumes where it stopped
+OPTUNA_STORAGE = "sqlite:///wfo.db"
 # The optimizer uses the same data files as the main bot
 COINS_FILE = os.path.join(os.path.dirname(__file__), "data/coins.json")
-ORDERS_FILE = os.path.join(os.path.dirname(__file__), "data/orders.json")
+ORDERS_FILE = os.path.join(os.path.dirname(__file__), "data/orders.ndjson")
 PORTFOLIO_FILE = os.path.join(os.path.dirname(__file__), "data/portfolio.json")
 
+# Search space for the moving-average windows
+FAST_WINDOW_RANGE = (10, 50)
+SLOW_WINDOW_RANGE = (51, 200)
+# Every window in the search space, in precomputed MA table column order
+MA_WINDOWS = np.arange(FAST_WINDOW_RANGE[0], SLOW_WINDOW_RANGE[1] + 1)
+
 TARGET_SYMBOL = "btc"  # Symbol to optimize for
+# Stored timestamps below this are epoch seconds, above it epoch milliseconds
+EPOCH_MS_THRESHOLD = 1e11
 TRANSACTION_FEES = 0.001  # Binance VIP level 0 taker fee is 0.1%
+INIT_CASH = 100.0  # vectorbt's default starting cash
+MIN_ORDER_SIZE = 1e-8  # vectorbt's default minimum order size
 # ... (rest of the file is the same)
-def load_price_data(symbol: str) -> pd.Series:
+def load_price_data(symbol: str) -> Tuple[np.ndarray, pd.DatetimeIndex]:
     """
-    Loads historical price data for a single coin from the JSON data store
-    and returns it as a pandas Series.
+    Loads historical price data for a single coin from the JSON data store.
+
+    Returns the closing prices as a contiguous float64 array together with
+    their timestamps. The optimizer slices and backtests the bare array, so
+    no pandas objects are built per fold or per trial.
     """
     logger.info(f"Loading historical data for {symbol}...")
     storage = JSONStorageAdapter(
@@ -59,19 +81,85 @@ def load_price_data(symbol: str) -> pd.Series:
     if not coin or not coin.prices:
         raise ValueError(f"No historical data found for symbol: {symbol}")
 
-    # Convert to DataFrame and set a proper DatetimeIndex
-    df = pd.DataFrame(coin.prices, columns=["timestamp", "open", "high", "low", "close"])
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s")
-    df = df.set_index("timestamp")
-    df = df.sort_index()
+    # Stored rows are OHLC candles ([timestamp, open, high, low, close, ...])
+    # from the initial load, and [timestamp, price] pairs from later price
+    # updates. Only the timestamp and close are needed, so they are read
+    # straight into float64 arrays without building a DataFrame.
+    rows = coin.prices
+    timestamps = np.fromiter(
+        (float(row[0]) for row in rows), dtype=np.float64, count=len(rows)
+    )
+    # vectorbt's numba kernels run in float64, so the closes are normalized
+    # to float64 once here rather than converted on every trial. (float32 is
+    # not used: vectorbt upcasts it anyway, and the rounding shifts crossover
+    # decisions.)
+    closes = np.fromiter(
+        (float(row[4] if len(row) > 4 else row[1]) for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+    # Candles are stamped in epoch milliseconds, price updates in seconds.
+    timestamps = np.where(
+        timestamps < EPOCH_MS_THRESHOLD, timestamps * 1000, timestamps
+    )
+    order = np.argsort(timestamps, kind="stable")
+    closes = np.ascontiguousarray(closes[order])
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps[order], unit="ms"))
+    logger.info(f"Loaded {len(closes)} data points for {symbol}.")
+    return closes, index
 
-    # vectorbt works with Series, so we'll use the closing price
-    price_series = df["close"]
-    logger.info(f"Loaded {len(price_series)} data points for {symbol}.")
-    return price_series
+
+def moving_averages(prices: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Returns the simple moving averages of `prices`, one column per window,
+    with each window's first `window - 1` rows left as NaN.
+
+    Every window is a difference of the same cumulative sum, so the whole
+    table costs one pass over the prices plus one subtraction per window.
+    This is the formula `vbt.MA.run` uses per window, and gives bit-identical
+    results for NaN-free prices.
+    """
+    cumsum = np.concatenate(([0.0], np.cumsum(prices)))
+    out = np.full((len(prices), len(windows)), np.nan)
+    for j, window in enumerate(windows):
+        out[window - 1 :, j] = (cumsum[window:] - cumsum[:-window]) / window
+    return out
 
 
-def run_backtest(price_series: pd.Series, params: dict) -> vbt.Portfolio:
+def precompute_moving_averages(prices: np.ndarray) -> np.ndarray:
+    """
+    Computes the moving average for every window in the search space in one
+    pass. Returns an array with one column per window in `MA_WINDOWS`, so
+    optimization trials look MAs up instead of recomputing them.
+    """
+    return moving_averages(prices, MA_WINDOWS)
+
+
+def slice_moving_averages(ma_table: np.ndarray, idx) -> np.ndarray:
+    """
+    Returns the rows `idx` of a `precompute_moving_averages` table built on
+    the full series, matching what `precompute_moving_averages` would return
+    for that slice alone: each window's first `window - 1` rows are blanked,
+    so a fold never sees prices from before its start.
+
+    This lets every fold reuse one full-series computation instead of
+    recomputing every window on its own overlapping slice.
+
+    Raises:
+        ValueError: If `idx` does not select a contiguous range of rows.
+    """
+    rows = np.arange(len(ma_table))[idx]
+    if len(rows) and np.any(np.diff(rows) != 1):
+        raise ValueError("Moving averages can only be sliced to a contiguous range.")
+    values = ma_table[rows]
+    for j, window in enumerate(MA_WINDOWS):
+        values[: window - 1, j] = np.nan
+    return values
+
+
+def run_backtest(
+    prices: np.ndarray, params: dict, ma_table: np.ndarray | None = None
+) -> vbt.Portfolio:
     """
     Runs a vectorized backtest for a given price series and strategy parameters.
 
@@ -79,15 +167,25 @@ def run_backtest(price_series: pd.Series, params: dict) -> vbt.Portfolio:
     per-datapoint decision logic is not easily vectorizable. This example uses
     a simple Moving Average Crossover strategy to demonstrate the `vectorbt`
     and WFO structure.
-    """
-    fast_ma = vbt.MA.run(price_series, params["fast_window"], short_name="fast")
-    slow_ma = vbt.MA.run(price_series, params["slow_window"], short_name="slow")
 
-    entries = fast_ma.ma_crossed_above(slow_ma)
-    exits = fast_ma.ma_crossed_below(slow_ma)
+    Args:
+        prices: Closing prices to trade on.
+        params: Strategy parameters (windows, stop loss, take profit).
+        ma_table: Optional output of `precompute_moving_averages` for
+            `prices`. When given, MAs are looked up instead of computed.
+    """
+    if ma_table is not None:
+        fast_ma = ma_table[:, params["fast_window"] - MA_WINDOWS[0]]
+        slow_ma = ma_table[:, params["slow_window"] - MA_WINDOWS[0]]
+    else:
+        fast_ma, slow_ma = moving_averages(
+            prices, np.array([params["fast_window"], params["slow_window"]])
+        ).T
+    entries = crossed_above_1d_nb(fast_ma, slow_ma)
+    exits = crossed_above_1d_nb(slow_ma, fast_ma)
 
     portfolio = vbt.Portfolio.from_signals(
-        price_series,
+        prices,
         entries,
         exits,
         fees=TRANSACTION_FEES,
@@ -98,81 +196,353 @@ def run_backtest(price_series: pd.Series, params: dict) -> vbt.Portfolio:
     return portfolio
 
 
-def run_wfo(price_series: pd.Series):
+@njit(cache=True)
+def simulate_crossover(
+    close: np.ndarray,
+    fast_ma: np.ndarray,
+    slow_ma: np.ndarray,
+    stop_loss: float,
+    take_profit: float,
+    fees: float,
+) -> float:
     """
-    Orchestrates the Walk-Forward Optimization process.
+    Returns the total return of the MA-crossover strategy in a single
+    compiled pass, without building any vectorbt objects.
+
+    Mirrors `run_backtest` with vectorbt's defaults: all-in long entries
+    when the fast MA crosses above the slow MA, full exits when it crosses
+    below, and stop-loss/take-profit levels relative to the entry close that
+    are checked against each later close before any signal. Conflicting
+    signals on the same bar are ignored.
     """
-    logger.info("--- Starting Walk-Forward Optimization ---")
+    cash = INIT_CASH
+    position = 0.0
+    entry_price = np.nan
+    # Crossover state, as in vectorbt's `crossed_above_1d_nb`
+    fast_was_below = False
+    fast_above_for = -1
+    slow_was_below = False
+    slow_above_for = -1
+
+    for i in range(close.shape[0]):
+        price = close[i]
+
+        entry = False
+        exit_ = False
+        if np.isnan(fast_ma[i]) or np.isnan(slow_ma[i]):
+            fast_was_below = slow_was_below = False
+            fast_above_for = slow_above_for = -1
+        elif fast_ma[i] > slow_ma[i]:
+            slow_was_below = True
+            slow_above_for = -1
+            if fast_was_below:
+                fast_above_for += 1
+                entry = fast_above_for == 0
+        elif fast_ma[i] < slow_ma[i]:
+            fast_was_below = True
+            fast_above_for = -1
+            if slow_was_below:
+                slow_above_for += 1
+                exit_ = slow_above_for == 0
+        else:
+            fast_above_for = slow_above_for = -1
+
+        if position > 0:
+            stop_hit = price <= entry_price * (1 - stop_loss) or (
+                entry_price * (1 + take_profit) <= price
+            )
+            if stop_hit:
+                cash += position * price - position * price * fees
+                position = 0.0
+                continue
+
+        if entry and not exit_ and position == 0:
+            spend = cash / (1 + fees)
+            size = spend / price
+            if size >= MIN_ORDER_SIZE:
+                position = size
+                cash = 0.0
+                entry_price = price
+        elif exit_ and not entry and position > 0:
+            cash += position * price - position * price * fees
+            position = 0.0
+
+    value = cash + position * close[-1]
+    return (value - INIT_CASH) / INIT_CASH
+
+
+def suggest_params(trial: optuna.Trial) -> dict:
+    """Samples a set of strategy parameters from the search space."""
+    return {
+        "fast_window": trial.suggest_int("fast_window", *FAST_WINDOW_RANGE),
+        "slow_window": trial.suggest_int("slow_window", *SLOW_WINDOW_RANGE),
+        "stop_loss": trial.suggest_float("stop_loss", 0.05, 0.30),
+        "take_profit": trial.suggest_float("take_profit", 0.10, 0.50),
+    }
+
+
+def objective(
+    trial: optuna.Trial, prices: np.ndarray, ma_table: np.ndarray | None = None
+) -> float:
+    """
+    Objective function for Optuna to maximize.
 
-    # Use vectorbt's built-in splitter for robust windowing
-    splitter = vbt.Splitter.from_rolling(
-        price_series,
-        N_FOLDS,
-        min_len=int(len(price_series) / N_FOLDS),
-        train_test_split=TRAIN_TEST_SPLIT,
+    The training window is scored on `PRUNING_STEPS` growing prefixes, each
+    reported to the pruner so poor parameters are dropped before the later,
+    longer backtests. The last prefix is the whole window, so completed trials
+    score exactly as a single full backtest would.
+    """
+    params = suggest_params(trial)
+
+    # Ensure fast_window is smaller than slow_window
+    if params["fast_window"] >= params["slow_window"]:
+        return -1.0  # Return a poor score to prune this trial
+
+    if ma_table is not None:
+        fast_ma = ma_table[:, params["fast_window"] - MA_WINDOWS[0]]
+        slow_ma = ma_table[:, params["slow_window"] - MA_WINDOWS[0]]
+
+    for step in range(1, PRUNING_STEPS + 1):
+        end = len(prices) * step // PRUNING_STEPS
+        if ma_table is None:
+            partial_return = run_backtest(prices[:end], params).total_return()
+        else:
+            partial_return = simulate_crossover(
+                prices[:end],
+                fast_ma[:end],
+                slow_ma[:end],
+                params["stop_loss"],
+                params["take_profit"],
+                TRANSACTION_FEES,
+            )
+        trial.report(partial_return, step)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    return partial_return
+
+
+def _get_sampler() -> optuna.samplers.BaseSampler:
+    """Returns the TPE sampler used for every fold's study."""
+    return optuna.samplers.TPESampler(multivariate=True)
+
+
+def _get_study_storage() -> optuna.storages.RDBStorage:
+    """
+    Returns the SQLite storage shared by the fold processes. The timeout lets
+    a process wait out another's write lock instead of failing.
+    """
+    return optuna.storages.RDBStorage(
+        OPTUNA_STORAGE, engine_kwargs={"connect_args": {"timeout": 60}}
     )
 
-    fold_results = []
-    latest_best_params = {}
 
-    for i, (train_idx, test_idx) in enumerate(splitter.split()):
-        logger.info(f"--- Processing Fold {i+1}/{N_FOLDS} ---")
+def _fold_study_name(index: pd.DatetimeIndex) -> str:
+    """
+    Names a fold's study after the symbol and training period, so a study is
+    only resumed on the exact data its trials were scored on.
+    """
+    return f"{TARGET_SYMBOL}_{index[0]:%Y%m%d%H%M}_{index[-1]:%Y%m%d%H%M}"
 
-        train_prices = price_series.iloc[train_idx]
-        test_prices = price_series.iloc[test_idx]
 
-        logger.info(
-            f"Train period: {train_prices.index[0]} to {train_prices.index[-1]} "
-            f"({len(train_prices)} points)"
-        )
-        logger.info(
-            f"Test period:  {test_prices.index[0]} to {test_prices.index[-1]} "
-            f"({len(test_prices)} points)"
+def _load_previous_params() -> dict | None:
+    """Returns the parameters saved by the last run, if there are any."""
+    try:
+        with open(PARAMS_FILE) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def run_fold(
+    study_name: str,
+    train_prices: np.ndarray,
+    test_prices: np.ndarray,
+    train_ma_table: np.ndarray,
+    test_ma_table: np.ndarray,
+    n_trials: int,
+    seed_params: dict | None = None,
+    validate: bool = False,
+) -> Tuple[dict, float, float, int]:
+    """
+    Optimizes one fold on its training prices and backtests the best
+    parameters on its test prices. Folds are independent, so each runs in its
+    own process; its trials run sequentially (`n_jobs=1`) because the
+    objective and Optuna's sampler hold the GIL and threads would only contend.
+
+    The study is loaded from `OPTUNA_STORAGE` if it exists and only runs the
+    trials still missing from `n_trials`. A new study first evaluates
+    `seed_params`, typically the previous run's best.
+
+    Returns the best parameters, their training return, the out-of-sample
+    return and the out-of-sample trade count.
+    """
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.create_study(
+        study_name=study_name,
+        storage=_get_study_storage(),
+        load_if_exists=True,
+        sampler=_get_sampler(),
+        direction="maximize",
+        pruner=optuna.pruners.HyperbandPruner(
+            min_resource=1, max_resource=PRUNING_STEPS, reduction_factor=3
+        ),
+    )
+    finished = study.get_trials(
+        deepcopy=False,
+        states=(optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED),
+    )
+    if not study.trials and seed_params:
+        study.enqueue_trial(seed_params, skip_if_exists=True)
+    if len(finished) < n_trials:
+        study.optimize(
+            functools.partial(objective, prices=train_prices, ma_table=train_ma_table),
+            n_trials=n_trials - len(finished),
+            n_jobs=1,
         )
+    best_params = study.best_params
+    if validate:
+        vbt_return = run_backtest(
+            train_prices, best_params, train_ma_table
+        ).total_return()
+        if not np.isclose(vbt_return, study.best_value, rtol=1e-9, atol=1e-12):
+            logger.warning(
+                f"Kernel return {study.best_value:.6%} differs from "
+                f"vectorbt return {vbt_return:.6%} for {best_params}."
+            )
+
+    test_portfolio = run_backtest(test_prices, best_params, test_ma_table)
+    return (
+        best_params,
+        study.best_value,
+        float(test_portfolio.total_return()),
+        int(test_portfolio.trades.count()),
+    )
 
-        # --- Optimization Step with Optuna ---
-        def objective(trial: optuna.Trial, prices: pd.Series) -> float:
-            """
-            Objective function for Optuna to maximize.
-            """
-            params = {
-                "fast_window": trial.suggest_int("fast_window", 10, 50),
-                "slow_window": trial.suggest_int("slow_window", 51, 200),
-                "stop_loss": trial.suggest_float("stop_loss", 0.05, 0.30),
-                "take_profit": trial.suggest_float("take_profit", 0.10, 0.50),
-            }
-
-            # Ensure fast_window is smaller than slow_window
-            if params["fast_window"] >= params["slow_window"]:
-                return -1.0  # Return a poor score to prune this trial
-
-            portfolio = run_backtest(prices, params)
-            return portfolio.total_return()
-
-        logger.info(f"Running Optuna optimization for {N_TRIALS} trials...")
-        study = optuna.create_study(
-            direction="maximize", pruner=optuna.pruners.MedianPruner()
+
+def _share_array(array: np.ndarray) -> shared_memory.SharedMemory:
+    """Copies `array` into a new shared memory block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+
+def _run_shared_fold(
+    study_name: str,
+    prices_name: str,
+    ma_table_name: str,
+    ma_table_shape: Tuple[int, int],
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    n_trials: int,
+    seed_params: dict | None = None,
+    validate: bool = False,
+) -> Tuple[dict, float, float, int]:
+    """
+    Runs `run_fold` in a worker process on rows of the full-series prices and
+    moving-average table, read from the shared memory blocks named
+    `prices_name` and `ma_table_name` instead of pickled per fold.
+    """
+    prices_shm = shared_memory.SharedMemory(name=prices_name)
+    ma_table_shm = shared_memory.SharedMemory(name=ma_table_name)
+    try:
+        prices = np.ndarray(
+            ma_table_shape[:1], dtype=np.float64, buffer=prices_shm.buf
         )
-        objective_with_data = functools.partial(objective, prices=train_prices)
-        study.optimize(
-            objective_with_data,
-            n_trials=N_TRIALS,
-            n_jobs=-1,
-        )  # Use all available CPU cores
+        ma_table = np.ndarray(
+            ma_table_shape, dtype=np.float64, buffer=ma_table_shm.buf
+        )
+        # Indexing copies, so the fold owns its arrays once the blocks close.
+        fold_arrays = (
+            prices[train_idx],
+            prices[test_idx],
+            slice_moving_averages(ma_table, train_idx),
+            slice_moving_averages(ma_table, test_idx),
+        )
+        del prices, ma_table
+    finally:
+        prices_shm.close()
+        ma_table_shm.close()
+    return run_fold(study_name, *fold_arrays, n_trials, seed_params, validate)
 
-        best_params = study.best_params
-        latest_best_params = best_params
-        logger.info(f"Optimization complete. Best Return: {study.best_value:.2%}")
-        logger.info(f"Best Parameters: {best_params}")
 
-        # --- Validation Step ---
-        logger.info("Validating parameters on out-of-sample test data...")
-        test_portfolio = run_backtest(test_prices, best_params)
-        fold_return = test_portfolio.total_return()
-        fold_results.append(fold_return)
+def run_wfo(prices: np.ndarray, index: pd.DatetimeIndex, validate: bool = False):
+    """
+    Orchestrates the Walk-Forward Optimization process over the closing
+    `prices` returned by `load_price_data`, timestamped by `index`.
 
-        logger.info(f"Fold {i+1} Out-of-Sample Return: {fold_return:.2%}")
-        logger.info(f"Total Trades: {test_portfolio.trades.count()}")
+    With `validate`, each fold's best training score from the compiled
+    `simulate_crossover` kernel is cross-checked against a full vectorbt
+    backtest.
+    """
+    logger.info("--- Starting Walk-Forward Optimization ---")
+
+    # Use vectorbt's built-in splitter for robust windowing
+    splitter = vbt.Splitter.from_rolling(
+        index,
+        N_FOLDS,
+        min_len=int(len(prices) / N_FOLDS),
+        train_test_split=TRAIN_TEST_SPLIT,
+    )
+    folds = list(splitter.split())
+
+    fold_results = []
+    latest_best_params = {}
+    # Folds overlap, so every MA is computed once over the whole series and
+    # each fold takes its rows from this table. Both are shared with the
+    # fold processes rather than copied into each one.
+    ma_table = precompute_moving_averages(prices)
+    prices_shm = _share_array(np.ascontiguousarray(prices, dtype=np.float64))
+    ma_table_shm = _share_array(ma_table)
+    seed_params = _load_previous_params()
+
+    n_workers = min(len(folds), os.cpu_count() or 1)
+    logger.info(
+        f"Running Optuna optimization for {N_TRIALS} trials per fold "
+        f"across {n_workers} processes..."
+    )
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_shared_fold,
+                    _fold_study_name(index[train_idx]),
+                    prices_shm.name,
+                    ma_table_shm.name,
+                    ma_table.shape,
+                    train_idx,
+                    test_idx,
+                    N_TRIALS,
+                    seed_params,
+                    validate,
+                )
+                for train_idx, test_idx in folds
+            ]
+
+            for i, ((train_idx, test_idx), future) in enumerate(zip(folds, futures, strict=True)):
+                logger.info(f"--- Fold {i+1}/{len(folds)} ---")
+                train_index = index[train_idx]
+                test_index = index[test_idx]
+                logger.info(
+                    f"Train period: {train_index[0]} to {train_index[-1]} "
+                    f"({len(train_idx)} points)"
+                )
+                logger.info(
+                    f"Test period:  {test_index[0]} to {test_index[-1]} "
+                    f"({len(test_idx)} points)"
+                )
+
+                best_params, best_value, fold_return, trade_count = future.result()
+                latest_best_params = best_params
+                fold_results.append(fold_return)
+                logger.info(f"Optimization complete. Best Return: {best_value:.2%}")
+                logger.info(f"Best Parameters: {best_params}")
+                logger.info(f"Fold {i+1} Out-of-Sample Return: {fold_return:.2%}")
+                logger.info(f"Total Trades: {trade_count}")
+    finally:
+        prices_shm.close()
+        prices_shm.unlink()
+        ma_table_shm.close()
+        ma_table_shm.unlink()
 
     # --- Save latest parameters for the Flywheel Effect ---
     if latest_best_params:
@@ -183,20 +553,31 @@ def run_wfo(price_series: pd.Series):
         logger.info(f"Saved parameters to {PARAMS_FILE}")
 
     # --- Final Report ---
-    total_return = np.prod([1 + r for r in fold_results]) - 1
+    fold_returns = np.fromiter(
+        fold_results, dtype=np.float64, count=len(fold_results)
+    )
+    total_return = (fold_returns + 1.0).prod() - 1.0
     logger.info("--- WFO Final Results ---")
     logger.info(f"Analyzed {N_FOLDS} folds.")
     logger.info(f"Total Out-of-Sample Return: {total_return:.2%}")
-    logger.info(f"Average Fold Return: {np.mean(fold_results):.2%}")
+    logger.info(f"Average Fold Return: {fold_returns.mean():.2%}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Walk-Forward Optimizer")
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Cross-check each fold's best trial against a full vectorbt backtest.",
+    )
+    args = parser.parse_args()
+
     # Suppress Optuna's informational messages
     optuna.logging.set_verbosity(optuna.logging.WARNING)
 
     try:
-        prices = load_price_data(TARGET_SYMBOL)
-        run_wfo(prices)
+        prices, index = load_price_data(TARGET_SYMBOL)
+        run_wfo(prices, index, validate=args.validate)
     except (ValueError, FileNotFoundError) as e:
         logger.error(f"Error: {e}", exc_info=True)
         logger.error(
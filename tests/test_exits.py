@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from domain.exits import select_exit_orders
+from domain.models.paper_order import PaperOrder
+from utils.load_env import TradeSettings
+
+TRADE = TradeSettings(
+    take_profit=10.0, stop_loss=5.0, order_amount=100.0, price_change_threshold=1.0
+)
+
+
+def _order(buy_price):
+    return PaperOrder(
+        timestamp=datetime(2024, 1, 1),
+        buy_price=buy_price,
+        quantity=1.0,
+        symbol="btc",
+        direction="BUY",
+    )
+
+
+def test_select_exit_orders_returns_only_triggered_orders():
+    """
+    Tests that orders are selected when the price reaches their stop-loss or
+    take-profit level, with the trigger and PnL percentage of each.
+    """
+    stop_loss = _order(110.0)
+    take_profit = _order(90.0)
+    orders = [stop_loss, _order(100.0), take_profit]
+
+    signals = select_exit_orders(orders, 100.0, TRADE)
+
+    assert [s.order for s in signals] == [stop_loss, take_profit]
+    assert [s.stop_loss_hit for s in signals] == [True, False]
+    assert signals[1].pnl_percentage == (100.0 - 90.0) / 90.0 * 100
+    assert select_exit_orders([], 100.0, TRADE) == []
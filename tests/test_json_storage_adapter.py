@@ -0,0 +1,131 @@
+import os
+from datetime import datetime
+
+import orjson
+import pytest
+
+from infrastructure.adapters.json_storage_adapter import JSONStorageAdapter
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JSONStorageAdapter(
+        coins_file=str(tmp_path / "coins.json"),
+        orders_file=str(tmp_path / "orders.json"),
+        portfolio_file=str(tmp_path / "portfolio.json"),
+    )
+
+
+def test_reads_are_served_from_cache_until_the_file_changes(storage):
+    """
+    Tests that an unchanged file is parsed once, and that an external write
+    to the file is picked up on the next read.
+    """
+    storage.add_coin("btc", "bitcoin")
+    first = storage._read_data(storage.coins_file)
+    assert storage._read_data(storage.coins_file) is first
+
+    with open(storage.coins_file, "wb") as f:
+        f.write(orjson.dumps([{"coinId": "ethereum", "symbol": "eth"}]))
+    stat = os.stat(storage.coins_file)
+    os.utime(storage.coins_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert [c.symbol for c in storage.get_all_coins()] == ["eth"]
+
+
+def test_writes_are_visible_to_subsequent_reads(storage):
+    """
+    Tests that the adapter's own writes invalidate the cached contents.
+    """
+    storage.add_coin("btc", "bitcoin")
+    storage.get_all_coins()
+    storage.add_prices_to_coin("btc", [[1, 1.0, 2.0, 0.5, 1.5]])
+    storage.update_coin_pnl("btc", 12.5)
+
+    coin = storage.get_coin_by_symbol("btc")
+    assert coin.prices == [[1, 1.0, 2.0, 0.5, 1.5]]
+    assert coin.realized_pnl == 12.5
+
+
+def test_transaction_flushes_each_file_once_on_exit(storage):
+    """
+    Tests that writes inside a transaction are buffered, visible to reads in
+    the same block, and persisted when the block exits.
+    """
+    storage.add_coin("btc", "bitcoin")
+    with storage.transaction():
+        storage.update_coin_price_change("btc", 3.5)
+        storage.insert_portfolio_item("btc", 100.0, 1.0)
+        storage.update_portfolio_item_by_symbol("btc", 110.0, 1.0)
+
+        assert storage.get_coin_by_symbol("btc").price_change == 3.5
+        assert storage.get_portfolio_item_by_symbol("btc").total_quantity == 2.0
+        assert not os.path.exists(storage.portfolio_file)
+
+    reloaded = JSONStorageAdapter(
+        storage.coins_file, storage.orders_file, storage.portfolio_file
+    )
+    assert reloaded.get_coin_by_symbol("btc").price_change == 3.5
+    assert reloaded.get_portfolio_item_by_symbol("btc").cost_basis == 110.0
+
+
+def test_transaction_keeps_records_written_by_another_process(storage):
+    """
+    Tests that a record another process writes while a transaction is open
+    is kept when the transaction flushes its buffered updates.
+    """
+    storage.add_coin("btc", "bitcoin")
+    storage.add_coin("eth", "ethereum")
+    other = JSONStorageAdapter(
+        storage.coins_file, storage.orders_file, storage.portfolio_file
+    )
+    with storage.transaction():
+        storage.update_coin_pnl("btc", 12.5)
+        other.add_prices_to_coin("eth", [[1, 1.0, 2.0, 0.5, 1.5]])
+        stat = os.stat(storage.coins_file)
+        os.utime(storage.coins_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    reloaded = JSONStorageAdapter(
+        storage.coins_file, storage.orders_file, storage.portfolio_file
+    )
+    assert reloaded.get_coin_by_symbol("btc").realized_pnl == 12.5
+    assert reloaded.get_coin_by_symbol("eth").prices == [[1, 1.0, 2.0, 0.5, 1.5]]
+
+def test_symbol_index_is_reused_across_writes(storage):
+    """
+    Tests that by-symbol updates keep the symbol index valid, that cached
+    records are not mutated in place, and that duplicate symbols are rejected.
+    """
+    storage.add_coin("btc", "bitcoin")
+    storage.add_coin("eth", "ethereum")
+    assert storage.add_coin("btc", "bitcoin") is None
+
+    before = storage._read_data(storage.coins_file)
+    index = storage._symbol_index(storage.coins_file, before)
+    storage.update_coin_price_change("eth", 4.0)
+    after = storage._read_data(storage.coins_file)
+
+    assert storage._symbol_index(storage.coins_file, after) is index
+    assert before[1]["priceChange"] == 0.0
+    assert storage.get_coin_by_symbol("eth").price_change == 4.0
+    assert storage.update_coin_pnl("doge", 1.0) is False
+
+
+def test_orders_are_appended_as_ndjson(storage):
+    """
+    Tests that each order is appended as one line, that orders inserted in a
+    transaction are readable before they are written, and that a truncated
+    trailing line is skipped.
+    """
+    storage.insert_order(datetime(2024, 1, 1), 100.0, 1.0, "btc", "BUY")
+    with storage.transaction():
+        storage.insert_order(datetime(2024, 1, 2), 110.0, 1.0, "btc", "SELL")
+        assert [o.direction for o in storage.get_all_orders()] == ["BUY", "SELL"]
+        with open(storage.orders_file, "rb") as f:
+            assert len(f.readlines()) == 1
+
+    with open(storage.orders_file, "ab") as f:
+        f.write(b'{"timestamp": "2024-01-03')
+
+    assert [o.buy_price for o in storage.get_all_orders("SELL")] == [110.0]
+    assert len(list(storage.get_all_orders())) == 2
@@ -0,0 +1,39 @@
+from domain.liquidity import select_safe_pools
+from utils.load_env import PoolSafetySettings
+
+THRESHOLDS = PoolSafetySettings(
+    min_volume_24h=1000.0, min_reserves_usd=5000.0, min_buys_24h=10.0
+)
+
+
+def _pool(reserve, volume, buys):
+    return {
+        "reserve_in_usd": reserve,
+        "volume_in_usd": {"h24": volume},
+        "buys_24h": buys,
+    }
+
+
+def test_select_safe_pools_keeps_only_pools_meeting_every_threshold():
+    """
+    Tests that a pool is kept only when reserves, volume and buys all meet
+    their minimums, and that the original order is preserved.
+    """
+    safe_a = _pool(5000.0, 1000.0, 10)
+    safe_b = _pool(9000.0, 2000.0, 50)
+    pools = [
+        safe_a,
+        _pool(4999.0, 1000.0, 10),
+        _pool(5000.0, 999.0, 10),
+        _pool(5000.0, 1000.0, 9),
+        safe_b,
+    ]
+    assert select_safe_pools(pools, THRESHOLDS) == [safe_a, safe_b]
+
+
+def test_select_safe_pools_treats_missing_metrics_as_zero():
+    """
+    Tests that pools without metrics are rejected rather than raising.
+    """
+    assert select_safe_pools([{}], THRESHOLDS) == []
+    assert select_safe_pools([], THRESHOLDS) == []
@@ -5,26 +5,39 @@ import pytest
 from infrastructure.adapters.binance_adapter import BinanceAdapter
 from infrastructure.adapters.coingecko_adapter import CoinGeckoAdapter
 from infrastructure.adapters.market_data_factory import get_market_data_adapter
-from utils.load_env import Settings
+from infrastructure.adapters.multi_market_data_adapter import MultiMarketDataAdapter
+from utils.load_env import ApiSettings, Settings
 
 
-def test_get_market_data_adapter_binance():
+@pytest.fixture
+def settings(monkeypatch):
+    # The Binance client pings the exchange on construction.
+    monkeypatch.setattr("infrastructure.adapters.binance_adapter.Client", Mock())
+    settings = Mock(spec=Settings)
+    settings.cg_api_key = "test-key"
+    settings.api = ApiSettings(
+        request_timeout=10, rate_limit_sleep=60, max_concurrency=5
+    )
+    return settings
+
+
+def test_get_market_data_adapter_binance(settings):
     """
-    Tests that the factory returns a BinanceAdapter when the provider is set to 'binance'.
+    Tests that the factory prioritizes a BinanceAdapter when the provider is set to 'binance'.
     """
-    settings = Mock(spec=Settings)
     settings.market_data_provider = "binance"
     adapter = get_market_data_adapter(settings)
-    assert isinstance(adapter, BinanceAdapter)
+    assert isinstance(adapter, MultiMarketDataAdapter)
+    assert [type(a) for a in adapter.adapters] == [BinanceAdapter, CoinGeckoAdapter]
 
-def test_get_market_data_adapter_coingecko():
+def test_get_market_data_adapter_coingecko(settings):
     """
-    Tests that the factory returns a CoinGeckoAdapter when the provider is set to 'coingecko'.
+    Tests that the factory prioritizes a CoinGeckoAdapter when the provider is set to 'coingecko'.
     """
-    settings = Mock(spec=Settings)
     settings.market_data_provider = "coingecko"
     adapter = get_market_data_adapter(settings)
-    assert isinstance(adapter, CoinGeckoAdapter)
+    assert isinstance(adapter, MultiMarketDataAdapter)
+    assert [type(a) for a in adapter.adapters] == [CoinGeckoAdapter, BinanceAdapter]
 
 def test_get_market_data_adapter_invalid():
     """
@@ -0,0 +1,134 @@
+import numpy as np
+import optuna
+import orjson
+import pytest
+import vectorbt as vbt
+
+import optimizer
+from optimizer import (
+    MA_WINDOWS,
+    TRANSACTION_FEES,
+    moving_averages,
+    objective,
+    precompute_moving_averages,
+    run_backtest,
+    simulate_crossover,
+    slice_moving_averages,
+)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600)))
+
+
+def test_sliced_moving_averages_match_a_fold_local_computation(prices):
+    """
+    Tests that slicing the full-series table gives the same warm-up NaNs and
+    values as computing the moving averages on the fold alone.
+    """
+    idx = np.arange(150, 450)
+    sliced = slice_moving_averages(precompute_moving_averages(prices), idx)
+    local = precompute_moving_averages(prices[idx])
+
+    np.testing.assert_array_equal(np.isnan(sliced), np.isnan(local))
+    np.testing.assert_allclose(sliced, local, rtol=1e-9)
+
+
+def test_slice_moving_averages_rejects_non_contiguous_rows(prices):
+    """
+    Tests that a selection with gaps is rejected, since the warm-up rows of
+    each window would no longer line up with the slice.
+    """
+    with pytest.raises(ValueError):
+        slice_moving_averages(precompute_moving_averages(prices), [0, 2, 3])
+
+
+def test_simulate_crossover_matches_vectorbt_backtest(prices):
+    """
+    Tests that the compiled kernel returns the same total return as the
+    vectorbt backtest, including trades closed by stop-loss/take-profit.
+    """
+    ma_table = precompute_moving_averages(prices)
+    param_sets = [
+        {"fast_window": 10, "slow_window": 60, "stop_loss": 0.05, "take_profit": 0.1},
+        {"fast_window": 25, "slow_window": 120, "stop_loss": 0.2, "take_profit": 0.4},
+        {"fast_window": 50, "slow_window": 51, "stop_loss": 0.3, "take_profit": 0.5},
+    ]
+
+    for params in param_sets:
+        expected = run_backtest(prices, params, ma_table).total_return()
+        actual = simulate_crossover(
+            prices,
+            ma_table[:, params["fast_window"] - MA_WINDOWS[0]],
+            ma_table[:, params["slow_window"] - MA_WINDOWS[0]],
+            params["stop_loss"],
+            params["take_profit"],
+            TRANSACTION_FEES,
+        )
+        assert actual == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_moving_averages_match_vectorbt(prices):
+    """
+    Tests that the shared-cumsum moving averages equal `vbt.MA.run` exactly,
+    including the NaN warm-up rows.
+    """
+    windows = np.array([10, 37, 200])
+    expected = vbt.MA.run(prices, window=windows.tolist()).ma.to_numpy()
+
+    np.testing.assert_array_equal(moving_averages(prices, windows), expected)
+
+
+def test_objective_scores_completed_trials_on_the_full_window(prices):
+    """
+    Tests that the step-wise objective returns the full-window kernel score.
+    """
+    params = {
+        "fast_window": 12,
+        "slow_window": 60,
+        "stop_loss": 0.1,
+        "take_profit": 0.2,
+    }
+    ma_table = precompute_moving_averages(prices)
+
+    score = objective(optuna.trial.FixedTrial(params), prices, ma_table)
+
+    assert score == simulate_crossover(
+        prices,
+        ma_table[:, params["fast_window"] - MA_WINDOWS[0]],
+        ma_table[:, params["slow_window"] - MA_WINDOWS[0]],
+        params["stop_loss"],
+        params["take_profit"],
+        TRANSACTION_FEES,
+    )
+
+
+def test_load_price_data_reads_candles_and_price_updates(tmp_path, monkeypatch):
+    """
+    Tests that millisecond OHLC candles and second-stamped [timestamp, price]
+    updates load into one time-ordered close series.
+    """
+    coins_file = tmp_path / "coins.json"
+    coins_file.write_bytes(
+        orjson.dumps(
+            [
+                {
+                    "coinId": "bitcoin",
+                    "symbol": "btc",
+                    "prices": [
+                        [1758384000000, 1.0, 2.0, 0.5, 11.0],
+                        [1758387600.0, 12.0],
+                        [1758380400000, 1.0, 2.0, 0.5, 10.0],
+                    ],
+                }
+            ]
+        )
+    )
+    monkeypatch.setattr(optimizer, "COINS_FILE", str(coins_file))
+
+    closes, index = optimizer.load_price_data("btc")
+
+    assert closes.tolist() == [10.0, 11.0, 12.0]
+    assert list(index.hour) == [15, 16, 17]
@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import pytest
+
+from domain.evaluator import Evaluator
+from domain.evaluator_v1 import EvaluatorV1
+from domain.evaluator_v2 import EvaluatorV2
+from domain.models.coin import Coin
+from domain.screening import select_candidates
+from utils.load_env import Settings, TradeSettings
+
+
+def _coin(symbol, price_change):
+    return Coin(
+        symbol=symbol,
+        coin_id=symbol,
+        realized_pnl=0.0,
+        prices=[],
+        price_change=price_change,
+    )
+
+
+def test_select_candidates_keeps_coins_at_or_above_the_threshold():
+    """
+    Tests that coins meeting the threshold are kept in their original order.
+    """
+    coins = [_coin("a", 5.0), _coin("b", 4.99), _coin("c", 12.0), _coin("d", -3.0)]
+
+    assert [c.symbol for c in select_candidates(coins, 5.0)] == ["a", "c"]
+    assert select_candidates([], 5.0) == []
+
+
+@pytest.mark.parametrize("evaluator_class", [Evaluator, EvaluatorV1, EvaluatorV2])
+def test_filter_candidates_agrees_with_is_candidate(evaluator_class):
+    """
+    Tests that each evaluator's vectorized filter keeps exactly the coins its
+    `is_candidate` accepts, including V2's stricter threshold.
+    """
+    config = Mock(spec=Settings)
+    config.trade = TradeSettings(
+        take_profit=10.0, stop_loss=5.0, order_amount=100.0, price_change_threshold=5.0
+    )
+    evaluator = evaluator_class(market_data=Mock(), config=config)
+    coins = [_coin("a", 5.0), _coin("b", 5.4), _coin("c", 5.6), _coin("d", -3.0)]
+
+    assert evaluator.filter_candidates(coins) == [
+        coin for coin in coins if evaluator.is_candidate(coin)
+    ]
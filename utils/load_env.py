@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional, cast
 
+import orjson
 from dotenv import load_dotenv
 
-# Load .env file unless in a production environment
-if os.getenv("ENVIRONMENT") != "production":
-    load_dotenv()
+# Load .env file unless in a production environment. Child processes inherit
+# the loaded variables, so the sentinel spares each worker a re-parse.
+if os.getenv("ENVIRONMENT") != "production" and not os.getenv("DOTENV_LOADED"):
+    load_dotenv(override=False)
+    os.environ["DOTENV_LOADED"] = "1"
 
 PARAMS_FILE = "best_params.json"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeSettings:
     """Runtime configuration that controls trading decisions."""
 
@@ -30,7 +33,7 @@ class TradeSettings:
     slow_window: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoolSafetySettings:
     """Thresholds used to filter CoinGecko pool data."""
 
@@ -39,7 +42,7 @@ class PoolSafetySettings:
     min_buys_24h: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DBSettings:
     """Database connection settings."""
 
@@ -51,15 +54,16 @@ class DBSettings:
     max_pool_connections: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApiSettings:
     """General settings for API interactions."""
 
     request_timeout: int
     rate_limit_sleep: int
+    max_concurrency: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoinGeckoSettings:
     """Settings specific to the CoinGecko adapter."""
 
@@ -67,7 +71,7 @@ class CoinGeckoSettings:
     coins_per_page: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CelerySettings:
     """Celery and Redis connection settings."""
 
@@ -75,7 +79,7 @@ class CelerySettings:
     result_backend: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Top-level settings container shared across the application."""
 
@@ -84,7 +88,9 @@ class Settings:
     coingecko: CoinGeckoSettings
     api: ApiSettings
     openai_api_key: str
+    openai_max_tokens: int
     prompt_template: str
+    prompt_price_rows: int
     trade: TradeSettings
     pool: PoolSafetySettings
     db: DBSettings
@@ -108,24 +114,33 @@ class Settings:
     binance_api_secret: Optional[str]
 
 
-def _get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
+def _get_secret(
+    env: Mapping[str, str], key: str, default: Optional[str] = None
+) -> Optional[str]:
     """
-    Retrieves a secret from environment variables.
+    Retrieves a secret from a snapshot of the environment variables.
     Returns None if the secret is not set and no default is provided.
     """
-    value = os.getenv(key, default)
-    if value is None and default is None:
-        return None
-    return value
+    return env.get(key, default)
 
 
-def _read_env_float(var_name: str, default: Optional[float] = None) -> float:
-    value = os.getenv(var_name)
-    if value is None:
-        if default is not None:
-            return default
-        raise ValueError(f"Environment variable '{var_name}' is required")
-    return float(value)
+def _read_env_float(
+    env: Mapping[str, str], var_name: str, default: Optional[float] = None
+) -> float:
+    if var_name in env:
+        return float(env[var_name])
+    if default is not None:
+        return default
+    raise ValueError(f"Environment variable '{var_name}' is required")
+
+
+@lru_cache(maxsize=8)
+def _read_prompt_template(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Reads a prompt template file. The file's mtime and size are part of the
+    cache key, so each version of the file is read only once.
+    """
+    return Path(path).read_text()
 
 
 def _load_prompt_template(path: Optional[str]) -> str:
@@ -140,35 +155,57 @@ def _load_prompt_template(path: Optional[str]) -> str:
     if not path:
         print("--- PROMPT_TEMPLATE env var not set, using default prompt. ---")
         return default_prompt
-    template_path = Path(path)
-    if not template_path.exists():
+    try:
+        stat = os.stat(path)
+    except OSError:
         print(
             f"--- Prompt template file '{path}' not found, using default prompt. ---"
         )
         return default_prompt
-    return template_path.read_text()
+    return _read_prompt_template(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_optimized_params(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parses the optimizer's parameters file. The file's mtime and size are
+    part of the cache key, so each version of the file is parsed only once.
+    """
+    return cast(Dict[str, Any], orjson.loads(Path(path).read_bytes()))
 
 
-def load_settings() -> Settings:
+def load_settings(env: Optional[Mapping[str, str]] = None) -> Settings:
     """
     Loads settings from the .env file and overrides them with dynamically
     optimized parameters if they exist (Flywheel Effect).
+
+    Variables are read from `env` when given, otherwise from a snapshot of
+    the process environment.
     """
+    # Read the environment once instead of through a lookup per variable
+    if env is None:
+        env = dict(os.environ)
+
     # 1. Load base settings from .env file
     trade_settings = TradeSettings(
-        take_profit=_read_env_float("TAKE_PROFIT", 0.05),
-        stop_loss=_read_env_float("STOP_LOSS", 0.02),
-        order_amount=_read_env_float("ORDER_AMOUNT", 100.0),
-        price_change_threshold=_read_env_float("PRICE_CHANGE", 0.02),
-        fast_window=int(_read_env_float("FAST_WINDOW", 21)),
-        slow_window=int(_read_env_float("SLOW_WINDOW", 50)),
+        take_profit=_read_env_float(env, "TAKE_PROFIT", 0.05),
+        stop_loss=_read_env_float(env, "STOP_LOSS", 0.02),
+        order_amount=_read_env_float(env, "ORDER_AMOUNT", 100.0),
+        price_change_threshold=_read_env_float(env, "PRICE_CHANGE", 0.02),
+        fast_window=int(_read_env_float(env, "FAST_WINDOW", 21)),
+        slow_window=int(_read_env_float(env, "SLOW_WINDOW", 50)),
     )
 
     # 2. Check for and apply optimized parameters
-    if Path(PARAMS_FILE).exists():
+    try:
+        params_stat: Optional[os.stat_result] = os.stat(PARAMS_FILE)
+    except OSError:
+        params_stat = None
+    if params_stat is not None:
         print(f"--- Found '{PARAMS_FILE}', applying optimized parameters. ---")
-        with open(PARAMS_FILE, "r") as f:
-            optimized_params = json.load(f)
+        optimized_params = _load_optimized_params(
+            PARAMS_FILE, params_stat.st_mtime_ns, params_stat.st_size
+        )
 
         # Create a new TradeSettings instance with overridden values
             # The `replace` function from dataclasses is perfect for this
@@ -177,32 +214,33 @@ def load_settings() -> Settings:
 
     # 3. Load other settings and assemble the final config
     db_settings = DBSettings(
-        host=_get_secret("DB_HOST", "localhost"),
-        port=int(_get_secret("DB_PORT", "5432")),
-        user=_get_secret("DB_USER", "user"),
-        password=_get_secret("DB_PASSWORD", "password"),
-        dbname=_get_secret("DB_NAME", "crypto_bot"),
-        max_pool_connections=int(_get_secret("DB_MAX_POOL_CONNECTIONS", "10")),
+        host=_get_secret(env, "DB_HOST", "localhost"),
+        port=int(_get_secret(env, "DB_PORT", "5432")),
+        user=_get_secret(env, "DB_USER", "user"),
+        password=_get_secret(env, "DB_PASSWORD", "password"),
+        dbname=_get_secret(env, "DB_NAME", "crypto_bot"),
+        max_pool_connections=int(_get_secret(env, "DB_MAX_POOL_CONNECTIONS", "10")),
     )
 
     api_settings = ApiSettings(
-        request_timeout=int(_get_secret("API_REQUEST_TIMEOUT", "10")),
-        rate_limit_sleep=int(_get_secret("API_RATE_LIMIT_SLEEP", "10")),
+        request_timeout=int(_get_secret(env, "API_REQUEST_TIMEOUT", "10")),
+        rate_limit_sleep=int(_get_secret(env, "API_RATE_LIMIT_SLEEP", "10")),
+        max_concurrency=int(_get_secret(env, "API_MAX_CONCURRENCY", "8")),
     )
 
     coingecko_settings = CoinGeckoSettings(
-        api_root=_get_secret("CG_API_ROOT", "https://api.coingecko.com/api/v3"),
-        coins_per_page=int(_get_secret("CG_COINS_PER_PAGE", "10")),
+        api_root=_get_secret(env, "CG_API_ROOT", "https://api.coingecko.com/api/v3"),
+        coins_per_page=int(_get_secret(env, "CG_COINS_PER_PAGE", "10")),
     )
 
     celery_settings = CelerySettings(
-        broker_url=_get_secret("CELERY_BROKER_URL", "redis://localhost:6379/0"),
-        result_backend=_get_secret("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
+        broker_url=_get_secret(env, "CELERY_BROKER_URL", "redis://localhost:6379/0"),
+        result_backend=_get_secret(env, "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
     )
 
-    binance_api_key = _get_secret("BN_API_KEY")
-    binance_api_secret = _get_secret("BN_API_SECRET")
-    cg_api_key = _get_secret("CG_API_KEY")
+    binance_api_key = _get_secret(env, "BN_API_KEY")
+    binance_api_secret = _get_secret(env, "BN_API_SECRET")
+    cg_api_key = _get_secret(env, "CG_API_KEY")
 
     market_data_provider: str
 
@@ -217,34 +255,36 @@ def load_settings() -> Settings:
         )
 
     settings = Settings(
-        environment=os.getenv("ENVIRONMENT", "development"),
+        environment=env.get("ENVIRONMENT", "development"),
         cg_api_key=cg_api_key,
         coingecko=coingecko_settings,
         api=api_settings,
-        openai_api_key=_get_secret("OPENAI_API_KEY", ""),
-        prompt_template=_load_prompt_template(os.getenv("PROMPT_TEMPLATE")),
+        openai_api_key=_get_secret(env, "OPENAI_API_KEY", ""),
+        openai_max_tokens=int(_read_env_float(env, "OPENAI_MAX_TOKENS", 300)),
+        prompt_template=_load_prompt_template(env.get("PROMPT_TEMPLATE")),
+        prompt_price_rows=int(_read_env_float(env, "PROMPT_PRICE_ROWS", 48)),
         trade=trade_settings,
         pool=PoolSafetySettings(
-            min_volume_24h=_read_env_float("MIN_VOLUME_24H", 10000.0),
-            min_reserves_usd=_read_env_float("MIN_RESERVES_USD", 50000.0),
-            min_buys_24h=_read_env_float("MIN_BUYS_24H", 10.0),
+            min_volume_24h=_read_env_float(env, "MIN_VOLUME_24H", 10000.0),
+            min_reserves_usd=_read_env_float(env, "MIN_RESERVES_USD", 50000.0),
+            min_buys_24h=_read_env_float(env, "MIN_BUYS_24H", 10.0),
         ),
         db=db_settings,
         celery=celery_settings,
-        storage_provider=os.getenv("STORAGE_PROVIDER", "json"),
-        engine_module=os.getenv("ENGINE_MODULE", "domain.engine"),
-        engine_class=os.getenv("ENGINE_CLASS", "Engine"),
-        evaluator_module=os.getenv("EVALUATOR_MODULE", "domain.evaluator"),
-        evaluator_class=os.getenv("EVALUATOR_CLASS", "Evaluator"),
-        evaluator_version=os.getenv("EVALUATOR_VERSION", "v1"),
-        strategy_module=os.getenv("STRATEGY_MODULE", "domain.strategy"),
-        strategy_class=os.getenv("STRATEGY_CLASS", "Strategy"),
-        strategy_version=os.getenv("STRATEGY_VERSION", "v1"),
-        shadow_mode_enabled=os.getenv("SHADOW_MODE_ENABLED", "False").lower() == "true",
-        shadow_evaluator_module=os.getenv("SHADOW_EVALUATOR_MODULE"),
-        shadow_evaluator_class=os.getenv("SHADOW_EVALUATOR_CLASS"),
-        shadow_strategy_module=os.getenv("SHADOW_STRATEGY_MODULE"),
-        shadow_strategy_class=os.getenv("SHADOW_STRATEGY_CLASS"),
+        storage_provider=env.get("STORAGE_PROVIDER", "json"),
+        engine_module=env.get("ENGINE_MODULE", "domain.engine"),
+        engine_class=env.get("ENGINE_CLASS", "Engine"),
+        evaluator_module=env.get("EVALUATOR_MODULE", "domain.evaluator"),
+        evaluator_class=env.get("EVALUATOR_CLASS", "Evaluator"),
+        evaluator_version=env.get("EVALUATOR_VERSION", "v1"),
+        strategy_module=env.get("STRATEGY_MODULE", "domain.strategy"),
+        strategy_class=env.get("STRATEGY_CLASS", "Strategy"),
+        strategy_version=env.get("STRATEGY_VERSION", "v1"),
+        shadow_mode_enabled=env.get("SHADOW_MODE_ENABLED", "False").lower() == "true",
+        shadow_evaluator_module=env.get("SHADOW_EVALUATOR_MODULE"),
+        shadow_evaluator_class=env.get("SHADOW_EVALUATOR_CLASS"),
+        shadow_strategy_module=env.get("SHADOW_STRATEGY_MODULE"),
+        shadow_strategy_class=env.get("SHADOW_STRATEGY_CLASS"),
         market_data_provider=market_data_provider,
         binance_api_key=binance_api_key,
         binance_api_secret=binance_api_secret,
@@ -252,7 +292,25 @@ def load_settings() -> Settings:
     return settings
 
 
-# Create a single, globally-used settings object
-settings = load_settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, loading them on the first call only.
+    """
+    return load_settings()
+
+
+class _LazySettings:
+    """
+    Stands in for the settings object and loads it on first attribute access,
+    so importing this module reads no files and needs no variables set.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+
+# A single, globally-used settings object
+settings = cast(Settings, _LazySettings())
 
-__all__ = ["settings", "Settings", "TradeSettings", "PoolSafetySettings", "DBSettings", "CelerySettings"]
+__all__ = ["settings", "get_settings", "Settings", "TradeSettings", "PoolSafetySettings", "DBSettings", "CelerySettings"]
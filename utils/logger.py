@@ -1,11 +1,17 @@
 """
 Configures a centralized, structured, and colored logger for the application.
 """
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
 from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Optional, Tuple
 
 import colorlog
 from pythonjsonlogger import jsonlogger
@@ -13,13 +19,29 @@ from pythonjsonlogger import jsonlogger
 from utils.load_env import settings
 
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "bot.log"
 
 # Context variable to hold a request ID for tracing
 request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
 
 
+@lru_cache(maxsize=None)
+def _component_fields(logger_name: str) -> Tuple[str, str]:
+    """
+    Returns the (component, version) pair logged for `logger_name`. Computed
+    once per logger rather than on every record.
+    """
+    # Extract component from logger name
+    component_name = logger_name.replace("trading_bot.", "")
+
+    # Add version based on component
+    if "evaluator" in component_name:
+        return component_name, settings.evaluator_version
+    if "strategy" in component_name:
+        return component_name, settings.strategy_version
+    return component_name, "N/A"
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
     Custom JSON formatter to add component, version, and request_id fields.
@@ -27,70 +49,148 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
 
     def add_fields(self, log_record, record, message_dict):
         super().add_fields(log_record, record, message_dict)
-        
-        # Extract component from logger name
-        component_name = record.name.replace("trading_bot.", "")
-        log_record["component"] = component_name
-        
-        # Add version based on component
-        if "evaluator" in component_name:
-            log_record["version"] = settings.evaluator_version
-        elif "strategy" in component_name:
-            log_record["version"] = settings.strategy_version
-        else:
-            log_record["version"] = "N/A"
 
-        # Add request_id from context
-        request_id = request_id_var.get()
+        log_record["component"], log_record["version"] = _component_fields(record.name)
+
+        # Add request_id from context. Records reach this formatter on the
+        # file listener's thread, so the ID is stamped where they were logged.
+        request_id = getattr(record, "request_id", None) or request_id_var.get()
         if request_id:
             log_record["request_id"] = request_id
 
 
-# 1. Create the main logger
-logger = logging.getLogger("trading_bot")
-logger.setLevel(logging.DEBUG)  # Set the lowest level to capture all messages
-
-# 2. Create a handler for console output with coloring
-console_handler = colorlog.StreamHandler(sys.stdout)
-console_formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)-8s%(reset)s %(blue)s%(name)-12s%(reset)s %(message)s",
-    log_colors={
-        "DEBUG": "cyan",
-        "INFO": "green",
-        "WARNING": "yellow",
-        "ERROR": "red",
-        "CRITICAL": "red,bg_white",
-    },
-)
-console_handler.setFormatter(console_formatter)
-console_handler.setLevel(logging.INFO)  # Only show INFO and above on console
-
-# 3. Create a rotating file handler for logs on disk
-# Rotates when the file reaches 40 MB, keeps 5 backup files.
-file_handler = logging.handlers.RotatingFileHandler(
-    LOG_FILE, maxBytes=40 * 1024 * 1024, backupCount=5
-)
-
-if settings.environment == "production":
-    # Use the custom JSON formatter for production
-    formatter = CustomJsonFormatter(
-        "%(asctime)s %(name)s %(levelname)s %(message)s"
-    )
-    file_handler.setFormatter(formatter)
-else:
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+def _stamp_request_id(record: logging.LogRecord) -> bool:
+    """Copies the logging thread's request ID onto the record."""
+    request_id = request_id_var.get()
+    if request_id:
+        record.request_id = request_id
+    return True
+
+
+_configure_lock = threading.Lock()
+_configured = False
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_file_listener(
+    queue_handler: logging.handlers.QueueHandler, file_handler: logging.Handler
+) -> None:
+    """
+    Gives `queue_handler` a fresh queue drained into `file_handler` by a
+    background thread. Also run in forked children (e.g. Celery workers),
+    which do not inherit the parent's listener thread.
+    """
+    global _file_listener
+    queue_handler.queue = queue.SimpleQueue()
+    _file_listener = logging.handlers.QueueListener(
+        queue_handler.queue, file_handler, respect_handler_level=True
     )
-    file_handler.setFormatter(file_formatter)
+    _file_listener.start()
+
+
+def _stop_file_listener() -> None:
+    """Flushes the queued records to the log file and stops the listener."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+def _configure() -> logging.Logger:
+    """
+    Builds the console and file handlers and attaches them to the main
+    logger. Runs once, when the first record is emitted, so importing this
+    module or calling get_logger() opens no files and starts no threads.
+    """
+    global _configured
+    main_logger = logging.getLogger("trading_bot")
+    if _configured:
+        return main_logger
+    with _configure_lock:
+        if _configured:
+            return main_logger
+
+        # 1. Create a handler for console output with coloring
+        console_handler = colorlog.StreamHandler(sys.stdout)
+        console_formatter = colorlog.ColoredFormatter(
+            "%(log_color)s%(levelname)-8s%(reset)s %(blue)s%(name)-12s%(reset)s %(message)s",
+            log_colors={
+                "DEBUG": "cyan",
+                "INFO": "green",
+                "WARNING": "yellow",
+                "ERROR": "red",
+                "CRITICAL": "red,bg_white",
+            },
+        )
+        console_handler.setFormatter(console_formatter)
+        console_handler.setLevel(logging.INFO)  # Only show INFO and above on console
+
+        # 2. Create a rotating file handler for logs on disk
+        # Rotates when the file reaches 40 MB, keeps 5 backup files.
+        LOG_DIR.mkdir(exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE, maxBytes=40 * 1024 * 1024, backupCount=5
+        )
+
+        # Read from the environment directly (as Settings.environment does) so
+        # that configuring logging does not load the full settings.
+        if os.getenv("ENVIRONMENT", "development") == "production":
+            # Use the custom JSON formatter for production
+            formatter: logging.Formatter = CustomJsonFormatter(
+                "%(asctime)s %(name)s %(levelname)s %(message)s"
+            )
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(logging.DEBUG)  # Log everything to the file
+
+        # 3. Write the file log on a background thread, so logging calls do
+        # not wait on disk writes and rotation.
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(_stamp_request_id)
+        _start_file_listener(queue_handler, file_handler)
+        os.register_at_fork(
+            after_in_child=lambda: _start_file_listener(queue_handler, file_handler)
+        )
+        atexit.register(_stop_file_listener)
+
+        # 4. Replace the bootstrap handler with the real ones. A new list is
+        # assigned rather than mutated, so a callHandlers() loop already
+        # iterating the old one does not also reach the new handlers.
+        main_logger.handlers = [console_handler, queue_handler]
+
+        _configured = True
+    return main_logger
+
+
+class _ConfigureOnFirstEmit(logging.Handler):
+    """
+    Placeholder handler that configures logging when the first record
+    reaches it, then hands that record to the real handlers.
+    """
 
-file_handler.setLevel(logging.DEBUG)  # Log everything to the file
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in _configure().handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
 
-# 4. Add the handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
 
+# Set up the main logger. This is cheap; handlers are built on first emit.
+_main_logger = logging.getLogger("trading_bot")
+_main_logger.setLevel(logging.DEBUG)  # Set the lowest level to capture all messages
+_main_logger.addHandler(_ConfigureOnFirstEmit())
 # Prevent logging from propagating to the root logger
-logger.propagate = False
+_main_logger.propagate = False
+
+
+def __getattr__(name: str) -> Any:
+    """Configures logging on first access to the module-level `logger`."""
+    if name == "logger":
+        return _configure()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_logger(name: str) -> logging.Logger:
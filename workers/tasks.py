@@ -1,15 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
 
 from celery import shared_task
 from domain.models.coin import Coin
+from domain.ports.data_storage_port import DataStoragePort
+from domain.ports.market_data_port import MarketDataPort
 from infrastructure.adapters.market_data_factory import get_market_data_adapter
 from infrastructure.adapters.storage_factory import get_storage_adapter
-from utils.load_env import settings
+from utils.load_env import get_settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_storage() -> DataStoragePort:
+    """
+    Returns the storage adapter shared by every task run in this worker
+    process, so its caches and connection pool outlive a single task.
+    """
+    return get_storage_adapter(get_settings())
+
+
+@lru_cache(maxsize=1)
+def _get_market_data() -> MarketDataPort:
+    """
+    Returns the market data adapter shared by every task run in this worker
+    process, so its HTTP session keeps connections alive between tasks.
+    """
+    return get_market_data_adapter(get_settings())
+
+
 @shared_task
 def initialize_coin_data_task():
     """
@@ -17,24 +39,34 @@ def initialize_coin_data_task():
     from the market data source if it's empty.
     """
     logger.info("Initializing coin data store...")
-    storage = get_storage_adapter(settings)
+    settings = get_settings()
+    storage = _get_storage()
 
     if len(storage.get_all_coins()) > 0:
         logger.info("Coin data store is already initialized, skipping.")
         return
 
     logger.info(f"Fetching initial coin list from {settings.market_data_provider}...")
-    market_data = get_market_data_adapter(settings)
+    market_data = _get_market_data()
     all_coins = market_data.get_coins()
 
-    for coin in all_coins:
-        logger.debug(f"Adding initial data for {coin.symbol}")
-        storage.add_coin(coin.symbol, coin.coin_id)
-
-        ohlc_data = market_data.get_historic_ohlc_by_coin_id(
-            coin.coin_id, days=1, interval="hourly"
+    # The OHLC lookups are independent network round-trips, so they overlap
+    # on a thread pool bounded like the engine's lookups. Results come back in
+    # coin order and are written from this thread only, inside one storage
+    # transaction so the store is written once rather than twice per coin.
+    with ThreadPoolExecutor(
+        max_workers=max(1, settings.api.max_concurrency)
+    ) as executor, storage.transaction():
+        all_ohlc_data = executor.map(
+            lambda coin: market_data.get_historic_ohlc_by_coin_id(
+                coin.coin_id, days=1, interval="hourly"
+            ),
+            all_coins,
         )
-        storage.add_prices_to_coin(coin.symbol, ohlc_data)
+        for coin, ohlc_data in zip(all_coins, all_ohlc_data, strict=True):
+            logger.debug("Adding initial data for %s", coin.symbol)
+            storage.add_coin(coin.symbol, coin.coin_id)
+            storage.add_prices_to_coin(coin.symbol, ohlc_data)
 
     logger.info(f"Added {len(all_coins)} coins to the data store.")
     logger.info(f"Added historical prices to {len(all_coins)} coins.")
@@ -46,8 +78,9 @@ def update_coin_prices_task() -> List[Coin]:
     Updates the local coin data store with the latest market data.
     """
     logger.info("Starting coin price update process...")
-    storage = get_storage_adapter(settings)
-    market_data = get_market_data_adapter(settings)
+    settings = get_settings()
+    storage = _get_storage()
+    market_data = _get_market_data()
 
     local_coins = storage.get_all_coins()
     local_coin_ids = {c.coin_id for c in local_coins}
@@ -60,16 +93,19 @@ def update_coin_prices_task() -> List[Coin]:
     latest_coins = market_data.get_coins()
     new_coins_count = 0
 
-    for coin in latest_coins:
-        if coin.coin_id not in local_coin_ids:
-            new_coins_count += 1
-            storage.add_coin(coin.symbol, coin.coin_id)
-            ohlc_data = market_data.get_historic_ohlc_by_coin_id(coin.coin_id, days=1)
-            storage.add_prices_to_coin(coin.symbol, ohlc_data)
-        else:
-            if coin.prices:
-                storage.add_prices_to_coin(coin.symbol, coin.prices)
-            storage.update_coin_price_change(coin.symbol, coin.price_change)
+    # One transaction, so the store is written once per tick instead of after
+    # every price append and price-change update.
+    with storage.transaction():
+        for coin in latest_coins:
+            if coin.coin_id not in local_coin_ids:
+                new_coins_count += 1
+                storage.add_coin(coin.symbol, coin.coin_id)
+                ohlc_data = market_data.get_historic_ohlc_by_coin_id(coin.coin_id, days=1)
+                storage.add_prices_to_coin(coin.symbol, ohlc_data)
+            else:
+                if coin.prices:
+                    storage.add_prices_to_coin(coin.symbol, coin.prices)
+                storage.update_coin_price_change(coin.symbol, coin.price_change)
 
     logger.info(f"Price data updated for {len(latest_coins)} coins.")
     if new_coins_count > 0: